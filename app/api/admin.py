@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, HTTPException
+
+from app.api.responses import FastJSONResponse
+from app.data.data_manager import data_manager as manager
+from app.data.database import run_in_db_thread
+from app.data.maintenance import database_stats
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/admin", tags=["admin"], default_response_class=FastJSONResponse)
+
+
+@router.get("/db/stats")
+async def get_database_stats() -> dict[str, object]:
+    """Report database size, free space and per-series row counts and bytes."""
+    try:
+        return await run_in_db_thread(database_stats, manager.backend)
+    except Exception as exc:
+        logger.exception("Unexpected database stats error")
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+
+@router.post("/db/maintenance")
+async def run_database_maintenance() -> dict[str, object]:
+    """Apply retention limits, reclaim free pages and refresh planner statistics now."""
+    try:
+        return await manager.run_maintenance()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Unexpected database maintenance error")
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
@@ -4,10 +4,11 @@ import logging
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.responses import FastJSONResponse
 from app.backtesting.backtester import Backtester
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["backtest"])
+router = APIRouter(prefix="/api", tags=["backtest"], default_response_class=FastJSONResponse)
 backtester = Backtester()
 
 
@@ -1,21 +1,91 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from datetime import datetime
 import logging
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 
-from app.data.data_manager import DataManager
+from app.api.responses import CandleFormat, FastJSONResponse, candle_response, dumps, encode_candles
+from app.data.data_manager import data_manager as manager
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["data"])
-manager = DataManager()
+router = APIRouter(prefix="/api", tags=["data"], default_response_class=FastJSONResponse)
+
+
+class BatchSeries(BaseModel):
+    asset: str
+    timeframe: str = "1h"
+
+
+class BatchRequest(BaseModel):
+    series: list[BatchSeries] = Field(..., min_length=1, max_length=500)
+    limit: int = Field(default=300, ge=1, le=5000)
+    refresh: bool = False
+    format: Literal["records", "columnar"] = "records"
+
+
+@router.get("/cache/stats")
+async def get_cache_stats() -> dict[str, int | float]:
+    """Report hit/miss counters of the in-memory candle tier."""
+    return manager.cache_stats()
+
+
+@router.get("/providers/stats")
+async def get_provider_stats() -> dict[str, dict[str, object]]:
+    """Report request pacing and circuit-breaker state of each upstream provider."""
+    return manager.provider_stats()
+
+
+@router.get("/prewarm/stats")
+async def get_prewarm_stats(request: Request) -> dict[str, object]:
+    """Report how far the watchlist pre-warmer runs behind its bar-boundary schedule."""
+    prewarmer = getattr(request.app.state, "prewarmer", None)
+    if prewarmer is None:
+        raise HTTPException(status_code=503, detail="Pre-warmer is not running")
+    return prewarmer.stats()
+
+
+@router.post("/data/batch")
+async def get_market_data_batch(request: BatchRequest) -> StreamingResponse:
+    """Stream many OHLCV series as NDJSON, one line per series as it completes.
+
+    Failed series are reported inline with the status code the single-asset
+    route would have returned, so one bad symbol does not fail the batch.
+    """
+    pairs = [(item.asset, item.timeframe) for item in request.series]
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for asset, timeframe, result in manager.iter_ohlcv_batch(pairs, limit=request.limit, refresh=request.refresh):
+            if isinstance(result, Exception):
+                line = {"asset": asset, "timeframe": timeframe, **_batch_error(asset, timeframe, result)}
+            else:
+                line = {**result, "data": encode_candles(result["data"], request.format)}
+            yield dumps(line) + b"\n"
+
+    # GZipMiddleware would buffer the stream until its compressor flushes;
+    # an explicit encoding makes it pass each line through as it completes.
+    return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"Content-Encoding": "identity"})
 
 
 @router.get("/data/{asset}")
-async def get_market_data(asset: str, timeframe: str = Query(default="1h")) -> dict[str, object]:
+async def get_market_data(
+    asset: str,
+    timeframe: str = Query(default="1h"),
+    refresh: bool = Query(default=False, description="Pull new candles from the provider before answering"),
+    candle_format: CandleFormat = Query(
+        default="records",
+        alias="format",
+        description="records (one object per candle), columnar (arrays, epoch-ms timestamps) or msgpack",
+    ),
+) -> Response:
     """Return unified OHLCV market data across supported asset classes."""
     try:
-        return await manager.get_ohlcv(asset=asset, timeframe=timeframe)
+        response = await manager.get_ohlcv(asset=asset, timeframe=timeframe, refresh=refresh)
+        return candle_response(response, candle_format)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -23,3 +93,91 @@ async def get_market_data(asset: str, timeframe: str = Query(default="1h")) -> d
     except Exception as exc:
         logger.exception("Unexpected data endpoint error for asset=%s timeframe=%s", asset, timeframe)
         raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+
+@router.post("/data/{asset}/backfill")
+async def backfill_market_data(
+    asset: str,
+    start: datetime = Query(..., description="Range start (ISO-8601, UTC if no offset)"),
+    end: datetime | None = Query(default=None, description="Range end; defaults to now"),
+    timeframe: str = Query(default="1h"),
+) -> dict[str, object]:
+    """Fetch a historical range page by page and store it in the local cache."""
+    try:
+        return await manager.backfill(asset=asset, timeframe=timeframe, start=start, end=end)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Unexpected backfill endpoint error for asset=%s timeframe=%s", asset, timeframe)
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+
+@router.get("/data/{asset}/gaps")
+async def get_market_data_gaps(asset: str, timeframe: str = Query(default="1h")) -> dict[str, object]:
+    """List missing bar ranges in the cached series (confirmed-empty ranges excluded)."""
+    try:
+        return await manager.scan_gaps(asset=asset, timeframe=timeframe)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Unexpected gap scan error for asset=%s timeframe=%s", asset, timeframe)
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+
+@router.post("/data/{asset}/gaps/fill")
+async def fill_market_data_gaps(
+    asset: str,
+    timeframe: str = Query(default="1h"),
+    max_gaps: int = Query(default=100, ge=1, le=10_000),
+) -> dict[str, object]:
+    """Fetch only the missing ranges of a cached series from its provider."""
+    try:
+        return await manager.fill_gaps(asset=asset, timeframe=timeframe, max_gaps=max_gaps)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Unexpected gap fill error for asset=%s timeframe=%s", asset, timeframe)
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+
+@router.get("/stream")
+async def get_live_streams() -> list[dict[str, object]]:
+    """List live-fed series with their connection state and buffered bars."""
+    return manager.live_stats()
+
+
+@router.post("/stream/{asset}")
+async def start_live_stream(asset: str, timeframe: str = Query(default="1m")) -> dict[str, object]:
+    """Stream a series from its provider's websocket feed into memory."""
+    try:
+        return manager.start_stream(asset=asset, timeframe=timeframe)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Unexpected stream start error for asset=%s timeframe=%s", asset, timeframe)
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+
+@router.delete("/stream/{asset}")
+async def stop_live_stream(asset: str, timeframe: str = Query(default="1m")) -> dict[str, object]:
+    """Stop a live feed after persisting its pending closed bars."""
+    try:
+        stopped = await manager.stop_stream(asset=asset, timeframe=timeframe)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if not stopped:
+        raise HTTPException(status_code=404, detail=f"No live stream for {asset} {timeframe}")
+    return {"asset": asset, "timeframe": timeframe, "stopped": True}
+
+
+def _batch_error(asset: str, timeframe: str, exc: Exception) -> dict[str, object]:
+    if isinstance(exc, ValueError):
+        return {"status": 400, "error": str(exc)}
+    if isinstance(exc, RuntimeError):
+        return {"status": 502, "error": str(exc)}
+    logger.error("Unexpected batch error for asset=%s timeframe=%s", asset, timeframe, exc_info=exc)
+    return {"status": 500, "error": "Internal server error"}
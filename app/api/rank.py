@@ -4,10 +4,11 @@ import logging
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.responses import FastJSONResponse
 from app.scoring.ranker import SignalRanker
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["ranking"])
+router = APIRouter(prefix="/api", tags=["ranking"], default_response_class=FastJSONResponse)
 ranker = SignalRanker()
 
 
@@ -4,12 +4,12 @@ import logging
 
 from fastapi import APIRouter, HTTPException, Query
 
-from app.data.data_manager import DataManager
+from app.api.responses import FastJSONResponse
+from app.data.data_manager import data_manager as manager
 from app.regime.regime_classifier import RegimeClassifier
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["regime"])
-manager = DataManager()
+router = APIRouter(prefix="/api", tags=["regime"], default_response_class=FastJSONResponse)
 classifier = RegimeClassifier()
 
 
@@ -4,10 +4,11 @@ import logging
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.responses import FastJSONResponse
 from app.backtesting.replay import HistoricalReplay
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["replay"])
+router = APIRouter(prefix="/api", tags=["replay"], default_response_class=FastJSONResponse)
 replay_engine = HistoricalReplay()
 
 
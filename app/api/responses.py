@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from typing import Any, Literal
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+
+from app.data.frame import OHLCVFrame
+
+CandleFormat = Literal["records", "columnar", "msgpack"]
+
+_HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+# orjson serializes several times faster than the stdlib encoder; it is an
+# optional dependency, so fall back to the standard response when missing.
+FastJSONResponse: type[JSONResponse] = ORJSONResponse if _HAS_ORJSON else JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact JSON bytes with the fastest available encoder."""
+    if _HAS_ORJSON:
+        import orjson
+
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def encode_candles(frame: OHLCVFrame, candle_format: CandleFormat) -> list[dict[str, object]] | dict[str, list]:
+    """Render candles as per-bar records or as columnar arrays with epoch-ms timestamps."""
+    if candle_format == "records":
+        return frame.to_records()
+    return frame.to_columns()
+
+
+def candle_response(payload: dict[str, object], candle_format: CandleFormat) -> Response:
+    """Serialize a ``DataManager`` result whose ``data`` is an ``OHLCVFrame``.
+
+    The response is built directly so FastAPI's generic ``jsonable_encoder``
+    pass over every candle is skipped.
+    """
+    content = {**payload, "data": encode_candles(payload["data"], candle_format)}
+    if candle_format == "msgpack":
+        if importlib.util.find_spec("msgpack") is None:
+            raise ValueError("format=msgpack requires the optional 'msgpack' package")
+        import msgpack
+
+        return Response(msgpack.packb(content), media_type="application/msgpack")
+    return FastJSONResponse(content)
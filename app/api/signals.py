@@ -4,10 +4,11 @@ import logging
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.api.responses import FastJSONResponse
 from app.signals.signal_manager import SignalManager
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["signals"])
+router = APIRouter(prefix="/api", tags=["signals"], default_response_class=FastJSONResponse)
 signal_manager = SignalManager()
 
 
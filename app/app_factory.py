@@ -1,24 +1,71 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from app.api.admin import router as admin_router
 from app.api.data import router as data_router
 from app.api.health import router as health_router
 from app.api.regime import router as regime_router
 from app.api.signals import router as signals_router
-from app.api.health import router as health_router
+from app.data.data_manager import data_manager
+from app.data.database import shutdown_db_executor
+from app.data.http_client import create_http_client
+from app.data.maintenance import MaintenanceScheduler
+from app.data.prewarmer import WatchlistPrewarmer
 from app.ui.router import router as ui_router
 from config import settings
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own process-wide resources: the pooled upstream HTTP client, DB threads
+    and background jobs (live streams, watchlist pre-warmer, DB maintenance)."""
+    async with create_http_client() as client:
+        data_manager.attach_http_client(client)
+        _start_configured_streams()
+        app.state.prewarmer = WatchlistPrewarmer.from_settings(data_manager)
+        app.state.prewarmer.start()
+        maintenance = MaintenanceScheduler(settings.maintenance_interval_seconds, data_manager.run_maintenance)
+        maintenance.start()
+        try:
+            yield
+        finally:
+            await maintenance.aclose()
+            await app.state.prewarmer.aclose()
+            await data_manager.aclose()
+            data_manager.attach_http_client(None)
+            shutdown_db_executor()
+
+
+def _start_configured_streams() -> None:
+    """Subscribe the ``asset@timeframe`` entries listed in ``LIVE_STREAMS``."""
+    for entry in filter(None, (item.strip() for item in settings.live_streams.split(","))):
+        asset, _, timeframe = entry.partition("@")
+        try:
+            data_manager.start_stream(asset, timeframe or "1m")
+        except ValueError:
+            logger.exception("Ignoring invalid LIVE_STREAMS entry %r", entry)
+
 
 def create_app() -> FastAPI:
     """Application factory for the Assemblief dashboard service."""
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    # Compresses any response above the threshold when the client sends
+    # ``Accept-Encoding: gzip``; candle histories shrink several-fold.
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_bytes)
     app.include_router(ui_router)
     app.include_router(health_router)
     app.include_router(data_router)
     app.include_router(regime_router)
     app.include_router(signals_router)
+    app.include_router(admin_router)
     app.mount("/static", StaticFiles(directory="app/ui/static"), name="static")
     return app
@@ -1,25 +1,37 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import asdict
 from typing import Any
 
 from app.backtesting.metrics import calculate_metrics
 from app.backtesting.robustness import evaluate_robustness, monte_carlo_stability, parameter_sensitivity
-from app.data.data_manager import DataManager
+from app.data.data_manager import data_manager
+from app.data.frame import OHLCVFrame
 
 
 class Backtester:
     """Backtesting engine with walk-forward and robustness checks."""
 
     def __init__(self) -> None:
-        self.data_manager = DataManager()
+        self.data_manager = data_manager
         self.transaction_cost = 0.0005
         self.slippage = 0.0008
 
-    async def run(self, asset: str, timeframe: str, signal_name: str) -> dict[str, Any]:
-        response = await self.data_manager.get_ohlcv(asset=asset, timeframe=timeframe)
-        candles: list[dict[str, Any]] = response["data"]
-        closes = [float(c["close"]) for c in candles]
+    async def run(
+        self,
+        asset: str,
+        timeframe: str,
+        signal_name: str,
+        candles_override: OHLCVFrame | None = None,
+    ) -> dict[str, Any]:
+        if candles_override is None:
+            response = await self.data_manager.get_ohlcv(asset=asset, timeframe=timeframe)
+            asset = response["asset"]
+            candles: OHLCVFrame = response["data"]
+        else:
+            candles = candles_override
+        closes = candles.close
         if len(closes) < 60:
             raise ValueError("Insufficient data for backtesting. Need at least 60 candles.")
 
@@ -27,7 +39,7 @@ class Backtester:
         in_sample = closes[:split]
         out_sample = closes[split:]
 
-        walk_forward = self._walk_forward(candles, signal_name)
+        walk_forward = self._walk_forward(closes, signal_name)
         oos_equity, oos_trades = self._simulate(out_sample, signal_name)
 
         overall_metrics = calculate_metrics(walk_forward["equity_curve"], walk_forward["trades"])
@@ -38,7 +50,7 @@ class Backtester:
         robust = evaluate_robustness(oos_metrics.cagr, oos_metrics.sharpe, mc_score, sensitivity)
 
         return {
-            "asset": response["asset"],
+            "asset": asset,
             "timeframe": timeframe,
             "signal": signal_name,
             "walk_forward": walk_forward,
@@ -55,14 +67,14 @@ class Backtester:
             "drawdown_curve": walk_forward["drawdown_curve"],
         }
 
-    def _walk_forward(self, candles: list[dict[str, Any]], signal_name: str) -> dict[str, Any]:
+    def _walk_forward(self, closes: Sequence[float], signal_name: str) -> dict[str, Any]:
         equity = [10000.0]
         trades: list[float] = []
         window = 40
-        for end in range(window, len(candles)):
-            train = candles[end - window:end]
-            test_close = float(candles[end]["close"])
-            prev_close = float(candles[end - 1]["close"])
+        for end in range(window, len(closes)):
+            train = closes[end - window:end]
+            test_close = closes[end]
+            prev_close = closes[end - 1]
             if prev_close == 0:
                 equity.append(equity[-1])
                 continue
@@ -86,12 +98,11 @@ class Backtester:
             "trades": [round(t, 6) for t in trades],
         }
 
-    def _simulate(self, closes: list[float], signal_name: str) -> tuple[list[float], list[float]]:
+    def _simulate(self, closes: Sequence[float], signal_name: str) -> tuple[list[float], list[float]]:
         equity = [10000.0]
         trades: list[float] = []
         for i in range(20, len(closes)):
-            hist = [{"close": c} for c in closes[i - 20:i]]
-            direction = self._signal_direction(hist, signal_name)
+            direction = self._signal_direction(closes[i - 20:i], signal_name)
             prev = closes[i - 1]
             if prev == 0:
                 equity.append(equity[-1])
@@ -102,8 +113,7 @@ class Backtester:
             equity.append(max(1.0, equity[-1] + pnl))
         return equity, trades
 
-    def _signal_direction(self, candles: list[dict[str, Any]], signal_name: str) -> float:
-        closes = [float(c["close"]) for c in candles if "close" in c]
+    def _signal_direction(self, closes: Sequence[float], signal_name: str) -> float:
         if len(closes) < 3:
             return 0.0
         short = sum(closes[-5:]) / min(5, len(closes))
@@ -114,7 +124,7 @@ class Backtester:
             return -1.0 if short >= long else 1.0
         raise ValueError("Unsupported signal. Use trend_v1, mean_reversion_v1, or breakout_v1.")
 
-    def _parameter_sensitivity_test(self, closes: list[float], signal_name: str) -> float:
+    def _parameter_sensitivity_test(self, closes: Sequence[float], signal_name: str) -> float:
         scores: list[float] = []
         for shift in (10, 15, 20, 25):
             subset = closes[-(shift + 40):] if len(closes) > shift + 40 else closes
@@ -4,7 +4,8 @@ from datetime import UTC, date, datetime, time
 from typing import Any
 
 from app.backtesting.backtester import Backtester
-from app.data.data_manager import DataManager
+from app.data.data_manager import data_manager
+from app.data.frame import OHLCVFrame, to_epoch_ms
 from app.regime.regime_classifier import RegimeClassifier
 from app.scoring.confidence import confidence_score
 
@@ -13,7 +14,7 @@ class HistoricalReplay:
     """Historical replay mode for regime, ranking, and trade outcome transparency."""
 
     def __init__(self) -> None:
-        self.data_manager = DataManager()
+        self.data_manager = data_manager
         self.backtester = Backtester()
         self.regime_classifier = RegimeClassifier()
         self.signal_ids = ["trend_v1", "mean_reversion_v1", "breakout_v1"]
@@ -49,29 +50,11 @@ class HistoricalReplay:
             "full_metrics": top["full_metrics"],
         }
 
-    def _split_by_date(self, candles: list[dict[str, Any]], target: date) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    def _split_by_date(self, candles: OHLCVFrame, target: date) -> tuple[OHLCVFrame, OHLCVFrame]:
         cutoff = datetime.combine(target, time(23, 59, 59), tzinfo=UTC)
-        historical: list[dict[str, Any]] = []
-        forward: list[dict[str, Any]] = []
-        for candle in candles:
-            ts = candle.get("timestamp")
-            parsed = self._parse_timestamp(ts)
-            if parsed <= cutoff:
-                historical.append(candle)
-            else:
-                forward.append(candle)
-        return historical, forward
-
-    def _parse_timestamp(self, value: Any) -> datetime:
-        if isinstance(value, datetime):
-            return value if value.tzinfo else value.replace(tzinfo=UTC)
-        if isinstance(value, str):
-            sanitized = value.replace("Z", "+00:00")
-            parsed = datetime.fromisoformat(sanitized)
-            return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
-        raise ValueError("Unsupported candle timestamp format")
-
-    async def _rank_historical(self, asset: str, timeframe: str, candles: list[dict[str, Any]], regime: str) -> list[dict[str, Any]]:
+        return candles.split_at(to_epoch_ms(cutoff))
+
+    async def _rank_historical(self, asset: str, timeframe: str, candles: OHLCVFrame, regime: str) -> list[dict[str, Any]]:
         ranked: list[dict[str, Any]] = []
         for signal in self.signal_ids:
             backtest = await self.backtester.run(asset=asset, timeframe=timeframe, signal_name=signal, candles_override=candles)
@@ -123,23 +106,23 @@ class HistoricalReplay:
         high = round(min(120.0, cagr * 1.3 + 5), 2)
         return f"{low}% to {high}%"
 
-    def _simulate_trade_outcome(self, signal: str, historical: list[dict[str, Any]], forward: list[dict[str, Any]]) -> dict[str, Any]:
+    def _simulate_trade_outcome(self, signal: str, historical: OHLCVFrame, forward: OHLCVFrame) -> dict[str, Any]:
         if not forward:
             return {
                 "bars_held": 0,
-                "entry_price": float(historical[-1]["close"]),
-                "exit_price": float(historical[-1]["close"]),
+                "entry_price": historical.close[-1],
+                "exit_price": historical.close[-1],
                 "return_pct": 0.0,
                 "status": "No forward candles after selected date.",
             }
 
-        entry = float(historical[-1]["close"])
+        entry = historical.close[-1]
         holding = forward[: min(10, len(forward))]
-        exit_price = float(holding[-1]["close"])
+        exit_price = holding.close[-1]
 
         trend_bias = 1.0
         if signal == "mean_reversion_v1":
-            recent = [float(c["close"]) for c in historical[-20:]]
+            recent = historical.close[-20:]
             short = sum(recent[-5:]) / min(5, len(recent))
             long = sum(recent) / len(recent)
             trend_bias = -1.0 if short >= long else 1.0
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import TypedDict
+from email.utils import parsedate_to_datetime
+import logging
+import time
+from typing import Any, TypedDict
 
+import httpx
+
+from app.data.circuit_breaker import CircuitBreaker
+from app.data.rate_limiter import AdaptiveRateLimiter
+from config import settings
+
+logger = logging.getLogger(__name__)
 
 SUPPORTED_TIMEFRAMES = {"1m", "5m", "1h", "1d", "1w"}
+TIMEFRAME_SECONDS = {"1m": 60, "5m": 300, "1h": 3600, "1d": 86400, "1w": 604800}
+# 418 is Binance's "IP banned after ignoring 429s"; both carry Retry-After.
+_THROTTLED_STATUSES = {418, 429}
 
 
 class OHLCVPoint(TypedDict):
@@ -21,11 +35,157 @@ class BaseDataProvider(ABC):
     """Contract for market-data providers."""
 
     name: str
+    client: httpx.AsyncClient | None = None
+    # Timeframes whose upstream bars follow trading sessions rather than UTC
+    # clock boundaries and therefore cannot be rebuilt from finer bars.
+    session_aligned_timeframes: frozenset[str] = frozenset()
+    # Request budget in weight units; subclasses size these to the upstream limit.
+    rate_limit_per_second: float = 5.0
+    rate_limit_burst: float = 10.0
+    supports_streaming: bool = False
+
+    def __init__(self) -> None:
+        self.rate_limiter = AdaptiveRateLimiter(rate=self.rate_limit_per_second, burst=self.rate_limit_burst)
+        self.circuit_breaker = CircuitBreaker(
+            self.name,
+            failure_threshold=settings.circuit_failure_threshold,
+            slow_call_seconds=settings.circuit_slow_call_seconds,
+            reset_seconds=settings.circuit_reset_seconds,
+        )
+
+    def attach_client(self, client: httpx.AsyncClient | None) -> None:
+        """Use a shared pooled client for upstream requests (``None`` detaches)."""
+        self.client = client
+
+    async def _get_json(self, url: str, params: dict[str, Any]) -> Any:
+        """GET ``url`` and decode JSON, paced by the provider's rate limiter.
+
+        Throttled responses are retried up to ``settings.upstream_max_retries``
+        times after the limiter's backoff; any other error status is raised.
+        Every request goes through the provider's circuit breaker, so an
+        unhealthy upstream fails fast with ``CircuitOpenError``.
+        """
+        attempt = 0
+        while True:
+            probe = self.circuit_breaker.before_call()
+            try:
+                await self.rate_limiter.acquire(self._request_weight(params))
+                response = await self._send_guarded(url, params)
+            except BaseException:
+                # A probe cancelled while pacing or in flight says nothing
+                # about upstream health; free the slot for the next caller.
+                if probe:
+                    self.circuit_breaker.release_probe()
+                raise
+            self._observe_response(response)
+            if response.status_code not in _THROTTLED_STATUSES:
+                break
+            if attempt >= settings.upstream_max_retries:
+                break
+            delay = self.rate_limiter.throttled(attempt, _retry_after_seconds(response))
+            logger.warning("%s throttled with HTTP %s; backing off %.1fs", self.name, response.status_code, delay)
+            attempt += 1
+        response.raise_for_status()
+        self.rate_limiter.succeeded()
+        return response.json()
+
+    async def _send_guarded(self, url: str, params: dict[str, Any]) -> httpx.Response:
+        """``_send`` with its outcome reported to the circuit breaker.
+
+        Transport errors (timeouts included) and 5xx responses are failures;
+        any other response shows the upstream is up, though a slow one still
+        counts against it.
+        """
+        started = time.monotonic()
+        try:
+            response = await self._send(url, params)
+        except httpx.TransportError:
+            self.circuit_breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success(time.monotonic() - started)
+        return response
+
+    async def _send(self, url: str, params: dict[str, Any]) -> httpx.Response:
+        """Issue the GET on the shared client when attached, else a one-off client."""
+        if self.client is not None:
+            return await self.client.get(url, params=params)
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            return await client.get(url, params=params)
+
+    def _request_weight(self, params: dict[str, Any]) -> float:
+        """Tokens one request with ``params`` costs against the upstream limit."""
+        return 1.0
+
+    def _observe_response(self, response: httpx.Response) -> None:
+        """Hook for providers that report their remaining budget in headers."""
 
     @abstractmethod
-    async def fetch_ohlcv(self, asset: str, timeframe: str, limit: int = 300) -> list[OHLCVPoint]:
-        """Fetch OHLCV data from upstream provider."""
+    async def fetch_ohlcv(
+        self,
+        asset: str,
+        timeframe: str,
+        limit: int = 300,
+        since: datetime | None = None,
+    ) -> list[OHLCVPoint]:
+        """Fetch OHLCV data from upstream provider.
+
+        When ``since`` is given only candles opening at or after it are returned,
+        which lets callers refresh the tail of a cached series incrementally.
+        """
+
+    async def iter_range(
+        self,
+        asset: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[list[OHLCVPoint]]:
+        """Yield candles opening in ``[start, end]`` as pages arrive.
+
+        Providers without a paginated history API answer with a single page from
+        ``fetch_ohlcv``; subclasses override this to split long ranges.
+        """
+        self.validate_timeframe(timeframe)
+        bars = int((end - start).total_seconds() // TIMEFRAME_SECONDS[timeframe]) + 1
+        points = await self.fetch_ohlcv(asset, timeframe, limit=bars, since=start)
+        yield [point for point in points if point["timestamp"] <= end]
+
+    def history_start(self, timeframe: str) -> datetime | None:
+        """Earliest open time the upstream still serves for ``timeframe``.
+
+        ``None`` means history is not truncated. Ranges before this bound are
+        unavailable rather than empty, so callers must not record them as gaps
+        the provider confirmed.
+        """
+        return None
+
+    async def stream_klines(self, asset: str, timeframe: str) -> AsyncIterator[tuple[OHLCVPoint, bool]]:
+        """Yield ``(candle, closed)`` updates from a live feed until it drops.
+
+        Updates for the forming bar repeat its open time with the latest
+        values; ``closed`` is True on the final update of a bar. Providers set
+        ``supports_streaming`` when they implement this.
+        """
+        raise ValueError(f"Provider '{self.name}' does not offer a streaming feed")
+        yield  # pragma: no cover - makes this an async generator
 
     def validate_timeframe(self, timeframe: str) -> None:
         if timeframe not in SUPPORTED_TIMEFRAMES:
             raise ValueError(f"Unsupported timeframe '{timeframe}'. Supported: {sorted(SUPPORTED_TIMEFRAMES)}")
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
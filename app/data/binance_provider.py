@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+import json
 import logging
+from typing import Any
 
 import httpx
 
-from app.data.base_provider import BaseDataProvider, OHLCVPoint
+from app.data.base_provider import TIMEFRAME_SECONDS, BaseDataProvider, OHLCVPoint
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -15,19 +20,111 @@ class BinanceProvider(BaseDataProvider):
 
     name = "binance"
     _base_url = "https://api.binance.com"
+    _page_size = 1000
+    supports_streaming = True
+    # Binance allows 6000 request weight per minute per IP; klines cost 2.
+    _weight_limit_per_minute = 6000
+    _klines_weight = 2.0
+    rate_limit_per_second = _weight_limit_per_minute / 60 * 0.9
+    rate_limit_burst = 300.0
 
-    async def fetch_ohlcv(self, asset: str, timeframe: str, limit: int = 300) -> list[OHLCVPoint]:
+    async def fetch_ohlcv(
+        self,
+        asset: str,
+        timeframe: str,
+        limit: int = 300,
+        since: datetime | None = None,
+    ) -> list[OHLCVPoint]:
         self.validate_timeframe(timeframe)
         symbol = asset.upper()
         endpoint = f"{self._base_url}/api/v3/klines"
-        params = {"symbol": symbol, "interval": timeframe, "limit": min(limit, 1000)}
+        params = {"symbol": symbol, "interval": timeframe, "limit": min(limit, self._page_size)}
+        if since is not None:
+            params["startTime"] = int(since.timestamp() * 1000)
 
         logger.info("Fetching %s %s candles from Binance", symbol, timeframe)
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(endpoint, params=params)
-            response.raise_for_status()
-            klines = response.json()
+        klines = await self._get_json(endpoint, params)
+        return self._parse_klines(klines)
 
+    async def iter_range(
+        self,
+        asset: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[list[OHLCVPoint]]:
+        """Backfill ``[start, end]`` in concurrent ``startTime``/``endTime`` pages.
+
+        The range is split into windows of at most 1000 bars, fetched with at
+        most ``settings.backfill_concurrency`` requests in flight. Pages are
+        yielded in completion order and de-duplicated by open time.
+        """
+        self.validate_timeframe(timeframe)
+        symbol = asset.upper()
+        endpoint = f"{self._base_url}/api/v3/klines"
+        start_ms = int(start.timestamp() * 1000)
+        end_ms = int(end.timestamp() * 1000)
+        span_ms = TIMEFRAME_SECONDS[timeframe] * 1000 * self._page_size
+        semaphore = asyncio.Semaphore(settings.backfill_concurrency)
+
+        async def fetch_page(page_start: int) -> list[OHLCVPoint]:
+            params = {
+                "symbol": symbol,
+                "interval": timeframe,
+                "startTime": page_start,
+                "endTime": min(page_start + span_ms - 1, end_ms),
+                "limit": self._page_size,
+            }
+            async with semaphore:
+                return self._parse_klines(await self._get_json(endpoint, params))
+
+        logger.info("Backfilling %s %s candles from Binance (%s -> %s)", symbol, timeframe, start, end)
+        tasks = [asyncio.create_task(fetch_page(page_start)) for page_start in range(start_ms, end_ms + 1, span_ms)]
+        seen: set[datetime] = set()
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                page = [point for point in await next_page if point["timestamp"] not in seen]
+                seen.update(point["timestamp"] for point in page)
+                yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled tasks unwind before the caller moves on.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def stream_klines(self, asset: str, timeframe: str) -> AsyncIterator[tuple[OHLCVPoint, bool]]:
+        """Follow the ``<symbol>@kline_<interval>`` websocket stream."""
+        self.validate_timeframe(timeframe)
+        # websockets ships with uvicorn[standard]; only streaming needs it.
+        import websockets
+
+        url = f"{settings.binance_stream_url.rstrip('/')}/{asset.lower()}@kline_{timeframe}"
+        logger.info("Streaming %s %s klines from %s", asset.upper(), timeframe, url)
+        async with websockets.connect(url, ping_interval=20, max_queue=256) as socket:
+            async for message in socket:
+                kline = json.loads(message).get("k")
+                if kline is None:
+                    continue
+                point: OHLCVPoint = {
+                    "timestamp": datetime.fromtimestamp(kline["t"] / 1000, tz=UTC),
+                    "open": float(kline["o"]),
+                    "high": float(kline["h"]),
+                    "low": float(kline["l"]),
+                    "close": float(kline["c"]),
+                    "volume": float(kline["v"]),
+                }
+                yield point, bool(kline["x"])
+
+    def _request_weight(self, params: dict[str, Any]) -> float:
+        return self._klines_weight
+
+    def _observe_response(self, response: httpx.Response) -> None:
+        used = response.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used is not None and used.isdigit():
+            # Keep a safety margin: other clients on this IP share the budget.
+            self.rate_limiter.sync_remaining(self._weight_limit_per_minute * 0.95 - int(used))
+
+    def _parse_klines(self, klines: list[list[object]]) -> list[OHLCVPoint]:
         points: list[OHLCVPoint] = []
         for row in klines:
             points.append(
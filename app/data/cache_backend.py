@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from datetime import datetime
+
+from app.data.frame import OHLCVFrame
+from app.data.gaps import BarRange
+
+
+class CacheBackend(ABC):
+    """Storage contract for cached (provider, asset, timeframe) candle series.
+
+    Implementations are synchronous and may block on disk; ``DataManager`` calls
+    them through ``run_in_db_thread``.
+    """
+
+    name: str
+
+    @abstractmethod
+    def load(self, provider: str, asset: str, timeframe: str, limit: int) -> OHLCVFrame:
+        """Return the newest ``limit`` candles in ascending time order."""
+
+    @abstractmethod
+    def last_refreshed_at(self, provider: str, asset: str, timeframe: str) -> datetime | None:
+        """Return when the series was last written (UTC)."""
+
+    @abstractmethod
+    def upsert(self, provider: str, asset: str, timeframe: str, frame: OHLCVFrame) -> int:
+        """Insert or overwrite candles keyed by open time; returns rows written."""
+
+    def upsert_many(self, batch: Mapping[tuple[str, str, str], OHLCVFrame]) -> int:
+        """Write several series at once; backends with transactions commit them together."""
+        return sum(self.upsert(provider, asset, timeframe, frame) for (provider, asset, timeframe), frame in batch.items())
+
+    @abstractmethod
+    def find_gaps(self, provider: str, asset: str, timeframe: str, step_ms: int) -> list[BarRange]:
+        """Return runs of missing bar opens between the stored candles."""
+
+    @abstractmethod
+    def empty_ranges(self, provider: str, asset: str, timeframe: str) -> list[BarRange]:
+        """Return ranges the provider confirmed have no candles."""
+
+    @abstractmethod
+    def record_empty_ranges(self, provider: str, asset: str, timeframe: str, ranges: list[BarRange]) -> None:
+        """Remember ranges the provider confirmed have no candles."""
+
+    @abstractmethod
+    def delete_before(self, provider: str, asset: str, timeframe: str, cutoff_ms: int) -> int:
+        """Drop candles opening before ``cutoff_ms``; returns rows removed."""
+
+    @abstractmethod
+    def series_stats(self) -> list[dict[str, object]]:
+        """Return ``provider``, ``asset``, ``timeframe``, ``rows``, ``approx_bytes`` and the
+        ``first``/``last`` open times (epoch ms) of every stored series."""
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail-fast guard around one provider's upstream requests.
+
+    ``failure_threshold`` consecutive failures open the circuit; a request that
+    succeeds but takes longer than ``slow_call_seconds`` counts as a failure
+    too. While open every request raises ``CircuitOpenError`` without touching
+    the network. After ``reset_seconds`` the circuit goes half-open and admits
+    a single probe: success closes it, failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, slow_call_seconds: float, reset_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_count = 0
+        self.rejected_count = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def allows_requests(self) -> bool:
+        """Whether a request now would be attempted (closed, or a probe is due)."""
+        if self.state == CLOSED:
+            return True
+        return not self._probe_in_flight and time.monotonic() - self._opened_at >= self.reset_seconds
+
+    def before_call(self) -> bool:
+        """Admit a request or raise ``CircuitOpenError``.
+
+        Returns True when the request is the half-open probe; its caller must
+        report an outcome or ``release_probe`` if it gives up.
+        """
+        if self.state == CLOSED:
+            return False
+        if not self.allows_requests:
+            self.rejected_count += 1
+            retry_in = max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+            raise CircuitOpenError(f"Provider '{self.name}' is unavailable; retrying upstream in {retry_in:.0f}s")
+        self.state = HALF_OPEN
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self, elapsed: float) -> None:
+        if elapsed > self.slow_call_seconds:
+            logger.warning("%s request took %.1fs (slow-call threshold %.1fs)", self.name, elapsed, self.slow_call_seconds)
+            self.record_failure()
+            return
+        if self.state != CLOSED:
+            logger.info("%s circuit closed after a successful probe", self.name)
+        self.state = CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened_count += 1
+                logger.warning("%s circuit opened after %s failures", self.name, self.failures)
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose outcome said nothing about health."""
+        self._probe_in_flight = False
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened_count,
+            "rejected": self.rejected_count,
+        }
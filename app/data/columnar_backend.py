@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import json
+import mmap
+import os
+from pathlib import Path
+import threading
+from urllib.parse import quote, unquote
+
+from app.data.cache_backend import CacheBackend
+from app.data.frame import OHLCVFrame, from_epoch_ms, to_epoch_ms
+from app.data.gaps import BarRange, find_gaps, merge_ranges
+
+_COLUMNS = (("timestamp", "q"), ("open", "d"), ("high", "d"), ("low", "d"), ("close", "d"), ("volume", "d"))
+_ITEM_SIZE = 8
+_MANIFEST = "manifest.json"
+_EMPTY_RANGES = "empty_ranges.json"
+
+
+@dataclass(frozen=True)
+class _Manifest:
+    rows: int
+    generation: int
+    refreshed_at: int | None
+
+
+class ColumnarCacheBackend(CacheBackend):
+    """Append-only, memory-mapped column files per candle series.
+
+    Each series lives in ``root/<provider>/<asset>/<timeframe>/`` as one
+    fixed-width file per column (int64 epoch-ms timestamps, float64 prices)
+    plus a small JSON manifest holding the committed row count. Reads copy
+    the requested window out of read-only mappings in one block per column.
+
+    Writes that only touch the tail (the forming bar plus new bars) overwrite
+    and extend the files in place, then publish the new row count through an
+    atomic manifest replace. Any other merge writes a new file generation and
+    unlinks the old one. Because reads copy, frames handed out earlier (e.g.
+    held by the memory tier) never change under their owner either way.
+    """
+
+    name = "columnar"
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._write_lock = threading.Lock()
+        self._maps: dict[Path, tuple[int, dict[str, memoryview]]] = {}
+        self._maps_lock = threading.Lock()
+
+    def load(self, provider: str, asset: str, timeframe: str, limit: int) -> OHLCVFrame:
+        directory = self._series_dir(provider, asset, timeframe)
+        manifest = self._read_manifest(directory)
+        if manifest is None or manifest.rows == 0:
+            return OHLCVFrame()
+        views = self._views(directory, manifest)
+        start = max(0, manifest.rows - limit)
+        return OHLCVFrame(**{name: _copy(views[name][start : manifest.rows], typecode) for name, typecode in _COLUMNS})
+
+    def last_refreshed_at(self, provider: str, asset: str, timeframe: str) -> datetime | None:
+        manifest = self._read_manifest(self._series_dir(provider, asset, timeframe))
+        if manifest is None or manifest.refreshed_at is None:
+            return None
+        return from_epoch_ms(manifest.refreshed_at)
+
+    def upsert(self, provider: str, asset: str, timeframe: str, frame: OHLCVFrame) -> int:
+        if not frame:
+            return 0
+        frame = OHLCVFrame().merge(frame)
+        directory = self._series_dir(provider, asset, timeframe)
+        refreshed_at = to_epoch_ms(datetime.now(UTC))
+        with self._write_lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            manifest = self._read_manifest(directory) or _Manifest(rows=0, generation=0, refreshed_at=None)
+            stored = self._views(directory, manifest)["timestamp"][: manifest.rows] if manifest.rows else array("q")
+            cut = bisect_left(stored, frame.timestamp[0])
+            overlap = stored[cut:]
+
+            if list(overlap) == list(frame.timestamp[: len(overlap)]):
+                # Incremental refresh: rewrite the overlapping tail, append the rest.
+                self._write_columns(directory, manifest.generation, frame, offset=cut)
+                self._write_manifest(directory, _Manifest(cut + len(frame), manifest.generation, refreshed_at))
+            else:
+                merged = self.load(provider, asset, timeframe, manifest.rows).merge(frame)
+                generation = manifest.generation + 1
+                self._write_columns(directory, generation, merged, offset=0)
+                self._write_manifest(directory, _Manifest(len(merged), generation, refreshed_at))
+                for name, _ in _COLUMNS:
+                    _column_path(directory, name, manifest.generation).unlink(missing_ok=True)
+        return len(frame)
+
+    def find_gaps(self, provider: str, asset: str, timeframe: str, step_ms: int) -> list[BarRange]:
+        directory = self._series_dir(provider, asset, timeframe)
+        manifest = self._read_manifest(directory)
+        if manifest is None or manifest.rows == 0:
+            return []
+        return find_gaps(self._views(directory, manifest)["timestamp"][: manifest.rows], step_ms)
+
+    def empty_ranges(self, provider: str, asset: str, timeframe: str) -> list[BarRange]:
+        try:
+            payload = json.loads((self._series_dir(provider, asset, timeframe) / _EMPTY_RANGES).read_text())
+        except FileNotFoundError:
+            return []
+        return sorted((start, end) for start, end in payload)
+
+    def record_empty_ranges(self, provider: str, asset: str, timeframe: str, ranges: list[BarRange]) -> None:
+        if not ranges:
+            return
+        directory = self._series_dir(provider, asset, timeframe)
+        with self._write_lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._write_empty_ranges(directory, merge_ranges([*self.empty_ranges(provider, asset, timeframe), *ranges]))
+
+    def delete_before(self, provider: str, asset: str, timeframe: str, cutoff_ms: int) -> int:
+        """Rewrite the kept rows as a new generation, like any non-tail merge, and
+        drop empty ranges that end before the cutoff."""
+        directory = self._series_dir(provider, asset, timeframe)
+        with self._write_lock:
+            empty = self.empty_ranges(provider, asset, timeframe)
+            kept_empty = [(start, end) for start, end in empty if end >= cutoff_ms]
+            if kept_empty != empty:
+                self._write_empty_ranges(directory, kept_empty)
+            manifest = self._read_manifest(directory)
+            if manifest is None or manifest.rows == 0:
+                return 0
+            cut = bisect_left(self._views(directory, manifest)["timestamp"][: manifest.rows], cutoff_ms)
+            if cut == 0:
+                return 0
+            kept = self.load(provider, asset, timeframe, manifest.rows)[cut:]
+            generation = manifest.generation + 1
+            self._write_columns(directory, generation, kept, offset=0)
+            self._write_manifest(directory, _Manifest(len(kept), generation, manifest.refreshed_at))
+            for name, _ in _COLUMNS:
+                _column_path(directory, name, manifest.generation).unlink(missing_ok=True)
+        return cut
+
+    def series_stats(self) -> list[dict[str, object]]:
+        stats: list[dict[str, object]] = []
+        for manifest_path in sorted(self.root.glob(f"*/*/*/{_MANIFEST}")):
+            directory = manifest_path.parent
+            manifest = self._read_manifest(directory)
+            if manifest is None or manifest.rows == 0:
+                continue
+            timestamps = self._views(directory, manifest)["timestamp"]
+            paths = [_column_path(directory, name, manifest.generation) for name, _ in _COLUMNS]
+            stats.append(
+                {
+                    "provider": unquote(directory.parent.parent.name),
+                    "asset": unquote(directory.parent.name),
+                    "timeframe": unquote(directory.name),
+                    "rows": manifest.rows,
+                    "approx_bytes": sum(path.stat().st_size for path in paths),
+                    "first": timestamps[0],
+                    "last": timestamps[manifest.rows - 1],
+                }
+            )
+        return stats
+
+    def _write_empty_ranges(self, directory: Path, ranges: list[BarRange]) -> None:
+        staging = directory / f"{_EMPTY_RANGES}.tmp"
+        staging.write_text(json.dumps(ranges))
+        os.replace(staging, directory / _EMPTY_RANGES)
+
+    def _series_dir(self, provider: str, asset: str, timeframe: str) -> Path:
+        return self.root / quote(provider, safe="") / quote(asset, safe="") / quote(timeframe, safe="")
+
+    def _read_manifest(self, directory: Path) -> _Manifest | None:
+        try:
+            payload = json.loads((directory / _MANIFEST).read_text())
+        except FileNotFoundError:
+            return None
+        return _Manifest(rows=payload["rows"], generation=payload["generation"], refreshed_at=payload.get("refreshed_at"))
+
+    def _write_manifest(self, directory: Path, manifest: _Manifest) -> None:
+        staging = directory / f"{_MANIFEST}.tmp"
+        staging.write_text(
+            json.dumps({"rows": manifest.rows, "generation": manifest.generation, "refreshed_at": manifest.refreshed_at})
+        )
+        os.replace(staging, directory / _MANIFEST)
+
+    def _write_columns(self, directory: Path, generation: int, frame: OHLCVFrame, offset: int) -> None:
+        for name, typecode in _COLUMNS:
+            path = _column_path(directory, name, generation)
+            with open(path, "r+b" if path.exists() else "wb") as handle:
+                handle.seek(offset * _ITEM_SIZE)
+                handle.write(array(typecode, getattr(frame, name)).tobytes())
+
+    def _views(self, directory: Path, manifest: _Manifest) -> dict[str, memoryview]:
+        """Return column views covering at least ``manifest.rows`` rows.
+
+        Mappings are cached per series and only replaced when the files have
+        grown or a new generation was written; old mappings stay alive for as
+        long as earlier frames reference them.
+        """
+        with self._maps_lock:
+            cached = self._maps.get(directory)
+            if cached is not None and cached[0] == manifest.generation:
+                views = cached[1]
+                if len(views["timestamp"]) >= manifest.rows:
+                    return views
+            views = {}
+            for name, typecode in _COLUMNS:
+                with open(_column_path(directory, name, manifest.generation), "rb") as handle:
+                    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                views[name] = memoryview(mapped).cast(typecode)
+            self._maps[directory] = (manifest.generation, views)
+            return views
+
+
+def _column_path(directory: Path, name: str, generation: int) -> Path:
+    return directory / f"{name}.{generation}.bin"
+
+
+def _copy(view: memoryview, typecode: str) -> array:
+    """Detach a column window from the mapping, which tail writes update in place."""
+    column = array(typecode)
+    column.frombytes(view.cast("B"))
+    return column
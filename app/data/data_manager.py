@@ -1,30 +1,78 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime
 import logging
 
 import httpx
-from sqlalchemy import delete, select
 
-from app.data.base_provider import OHLCVPoint
+from app.data.base_provider import TIMEFRAME_SECONDS, BaseDataProvider, OHLCVPoint
 from app.data.binance_provider import BinanceProvider
-from app.data.database import get_db_session
+from app.data.cache_backend import CacheBackend
+from app.data.circuit_breaker import CircuitOpenError
+from app.data.columnar_backend import ColumnarCacheBackend
+from app.data.database import run_in_db_thread
 from app.data.forex_provider import ForexProvider
+from app.data.frame import OHLCVFrame, from_epoch_ms, to_epoch_ms
+from app.data.freshness import bar_open_ms, is_stale
 from app.data.futures_provider import FuturesProvider
-from app.data.models import OHLCVCache
+from app.data.gaps import BarRange, missing_runs, subtract_ranges
+from app.data.live_feed import LiveFeed
+from app.data.maintenance import run_maintenance
+from app.data.memory_cache import CandleMemoryCache
+from app.data.resample import finer_timeframes, resample
+from app.data.sqlite_backend import SQLiteCacheBackend
+from app.data.write_behind import WriteBehindWriter
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on finer-grained rows read to build one resampled series.
+_MAX_RESAMPLE_SOURCE_ROWS = 100_000
+
 
 class DataManager:
-    """Unified market-data entrypoint with local SQLite caching."""
+    """Unified market-data entrypoint with local candle caching.
+
+    Storage is delegated to a ``CacheBackend`` (SQLite rows by default, or
+    memory-mapped column files). Public coroutines never touch it on the event
+    loop: memory-tier hits are answered inline and everything else runs
+    through ``run_in_db_thread``. Refreshes and live bars are persisted
+    write-behind by a single background writer.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, backend: CacheBackend | None = None) -> None:
+        self.backend = backend or _default_backend()
         self.providers = {
             "crypto": BinanceProvider(),
             "forex": ForexProvider(),
             "futures": FuturesProvider(),
         }
+        # In-flight ingest per series and the window size it fetches.
+        self._inflight: dict[tuple[str, str, str], tuple[asyncio.Task[int], int]] = {}
+        self._memory = CandleMemoryCache(max_rows=settings.memory_cache_max_rows)
+        self._live = LiveFeed(self._persist_live_bars, settings.live_buffer_bars, settings.live_flush_seconds)
+        # A dropped write must not leave the memory tier claiming bars that
+        # storage lacks: the next refresh would start after them.
+        self._writer = WriteBehindWriter(
+            self.backend, on_failure=self._memory.invalidate, max_pending=settings.write_behind_max_pending
+        )
+
+    def attach_http_client(self, client: httpx.AsyncClient | None) -> None:
+        """Inject the shared pooled HTTP client into every provider."""
+        for provider in self.providers.values():
+            provider.attach_client(client)
+
+    async def aclose(self) -> None:
+        """Stop live feeds, cancel in-flight refreshes and commit queued writes."""
+        await self._live.aclose()
+        tasks = [task for task, _ in self._inflight.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._writer.aclose()
 
     def _resolve_market(self, asset: str) -> tuple[str, str]:
         if ":" in asset:
@@ -41,91 +89,505 @@ class DataManager:
             return "forex", symbol[:-2]
         raise ValueError("Asset must include market prefix (crypto:, forex:, futures:) or a known symbol suffix")
 
-    async def get_ohlcv(self, asset: str, timeframe: str, limit: int = 300) -> dict[str, object]:
+    def provider_for(self, asset: str) -> BaseDataProvider:
+        """Return the provider that serves ``asset``."""
+        market, _ = self._resolve_market(asset)
+        return self.providers[market]
+
+    async def get_ohlcv(self, asset: str, timeframe: str, limit: int = 300, refresh: bool = False) -> dict[str, object]:
         market, symbol = self._resolve_market(asset)
         provider = self.providers[market]
 
-        cached_points = self._load_cached(provider.name, symbol, timeframe, limit)
-        if cached_points:
-            logger.info("Serving %s/%s %s candles from cache", market, symbol, timeframe)
+        if not refresh:
+            live = self._live.window((provider.name, symbol, timeframe), limit)
+            if live is not None:
+                return {
+                    "asset": f"{market}:{symbol}",
+                    "provider": provider.name,
+                    "timeframe": timeframe,
+                    "source": "live",
+                    "revalidating": False,
+                    "rows": len(live),
+                    "data": live,
+                }
+            cached_points, refreshed_at = await self._read_window(provider.name, symbol, timeframe, limit)
+            stale = self._is_stale(refreshed_at, timeframe)
+            if stale:
+                resampled = await self._resample_from_finer(provider, symbol, timeframe, limit)
+                if resampled is not None:
+                    frame, source_timeframe = resampled
+                    logger.info("Serving %s/%s %s candles resampled from %s", market, symbol, timeframe, source_timeframe)
+                    return {
+                        "asset": f"{market}:{symbol}",
+                        "provider": provider.name,
+                        "timeframe": timeframe,
+                        "source": "resampled",
+                        "resampled_from": source_timeframe,
+                        "revalidating": False,
+                        "rows": len(frame),
+                        "data": frame,
+                    }
+            if cached_points:
+                source = "cache"
+                revalidating = stale and provider.circuit_breaker.allows_requests
+                if revalidating:
+                    self._start_ingest(provider, market, symbol, timeframe, limit)
+                elif stale:
+                    # Upstream circuit is open: answer now rather than queue a
+                    # refresh that would only be rejected.
+                    source = "stale"
+                logger.info("Serving %s/%s %s candles from %s", market, symbol, timeframe, source)
+                return {
+                    "asset": f"{market}:{symbol}",
+                    "provider": provider.name,
+                    "timeframe": timeframe,
+                    "source": source,
+                    "revalidating": revalidating,
+                    "rows": len(cached_points),
+                    "data": cached_points,
+                }
+
+        try:
+            await self._refresh(provider, market, symbol, timeframe, limit)
+        except RuntimeError:
+            points, _ = await self._read_window(provider.name, symbol, timeframe, limit)
+            if not points:
+                raise
+            logger.warning("Upstream failed for %s/%s %s; serving stale cached candles", market, symbol, timeframe)
             return {
                 "asset": f"{market}:{symbol}",
                 "provider": provider.name,
                 "timeframe": timeframe,
-                "source": "cache",
-                "rows": len(cached_points),
-                "data": cached_points,
+                "source": "stale",
+                "revalidating": False,
+                "rows": len(points),
+                "data": points,
             }
+        points, _ = await self._read_window(provider.name, symbol, timeframe, limit)
+        return {
+            "asset": f"{market}:{symbol}",
+            "provider": provider.name,
+            "timeframe": timeframe,
+            "source": "provider",
+            "revalidating": False,
+            "rows": len(points),
+            "data": points,
+        }
+
+    async def backfill(
+        self,
+        asset: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime | None = None,
+    ) -> dict[str, object]:
+        """Load a historical range into the cache, page by page.
+
+        Pages go to the write-behind writer as soon as the provider returns
+        them, so a multi-year job never holds the whole range in memory and
+        partial progress survives a failure part-way through. The job returns
+        once its pages are committed.
+        """
+        market, symbol = self._resolve_market(asset)
+        provider = self.providers[market]
+        start = _as_utc(start)
+        end = _as_utc(end) if end is not None else datetime.now(UTC)
+        if start >= end:
+            raise ValueError("Backfill start must be before end")
 
+        key = (provider.name, symbol, timeframe)
+        pages = 0
+        rows = 0
         try:
-            fetched_points = await provider.fetch_ohlcv(symbol, timeframe, limit=limit)
-        except httpx.HTTPError as exc:
-            logger.exception("Provider HTTP error for %s/%s", market, symbol)
-            raise RuntimeError("Upstream provider request failed") from exc
-        except ValueError:
-            raise
-        except Exception as exc:
-            logger.exception("Unexpected provider error for %s/%s", market, symbol)
-            raise RuntimeError("Unexpected error fetching market data") from exc
-
-        self._store_points(provider.name, symbol, timeframe, fetched_points)
+            with _provider_errors(market, symbol):
+                async for page in provider.iter_range(symbol, timeframe, start, end):
+                    await self._writer.submit(key, OHLCVFrame.from_points(page))
+                    pages += 1
+                    rows += len(page)
+        finally:
+            await self._writer.flush()
+            self._memory.invalidate(key)
+
+        logger.info("Backfilled %s %s/%s %s candles in %s pages", rows, market, symbol, timeframe, pages)
         return {
             "asset": f"{market}:{symbol}",
             "provider": provider.name,
             "timeframe": timeframe,
-            "source": "provider",
-            "rows": len(fetched_points),
-            "data": fetched_points,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "pages": pages,
+            "rows": rows,
         }
 
-    def _load_cached(self, provider: str, asset: str, timeframe: str, limit: int) -> list[dict[str, object]]:
-        with get_db_session() as session:
-            stmt = (
-                select(OHLCVCache)
-                .where(OHLCVCache.provider == provider)
-                .where(OHLCVCache.asset == asset)
-                .where(OHLCVCache.timeframe == timeframe)
-                .order_by(OHLCVCache.timestamp.asc())
-            )
-            rows = session.execute(stmt).scalars().all()
-
-        if not rows:
-            return []
-
-        rows = rows[-limit:]
-        return [
-            {
-                "timestamp": row.timestamp.isoformat(),
-                "open": row.open,
-                "high": row.high,
-                "low": row.low,
-                "close": row.close,
-                "volume": row.volume,
-            }
-            for row in rows
-        ]
-
-    def _store_points(self, provider: str, asset: str, timeframe: str, points: list[OHLCVPoint]) -> None:
-        if not points:
-            return
-        with get_db_session() as session:
-            session.execute(
-                delete(OHLCVCache)
-                .where(OHLCVCache.provider == provider)
-                .where(OHLCVCache.asset == asset)
-                .where(OHLCVCache.timeframe == timeframe)
-            )
-            for point in points:
-                session.add(
-                    OHLCVCache(
-                        provider=provider,
-                        asset=asset,
-                        timeframe=timeframe,
-                        timestamp=point["timestamp"] if isinstance(point["timestamp"], datetime) else datetime.fromisoformat(str(point["timestamp"])),
-                        open=point["open"],
-                        high=point["high"],
-                        low=point["low"],
-                        close=point["close"],
-                        volume=point["volume"],
-                    )
-                )
+    async def iter_ohlcv_batch(
+        self,
+        series: Sequence[tuple[str, str]],
+        limit: int = 300,
+        refresh: bool = False,
+    ) -> AsyncIterator[tuple[str, str, dict[str, object] | Exception]]:
+        """Resolve many ``(asset, timeframe)`` pairs concurrently.
+
+        Requests run together but at most ``settings.batch_provider_concurrency``
+        at a time per provider. Results are yielded as each series completes;
+        failures are yielded as the exception instead of aborting the batch.
+        """
+        limits: dict[str, asyncio.Semaphore] = {}
+
+        async def load(asset: str, timeframe: str) -> tuple[str, str, dict[str, object] | Exception]:
+            try:
+                market, _ = self._resolve_market(asset)
+                semaphore = limits.setdefault(market, asyncio.Semaphore(settings.batch_provider_concurrency))
+                async with semaphore:
+                    return asset, timeframe, await self.get_ohlcv(asset, timeframe, limit=limit, refresh=refresh)
+            except Exception as exc:
+                return asset, timeframe, exc
+
+        tasks = [asyncio.create_task(load(asset, timeframe)) for asset, timeframe in series]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled tasks unwind before the caller moves on.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def scan_gaps(self, asset: str, timeframe: str) -> dict[str, object]:
+        """Report missing bar ranges of a cached series, minus confirmed-empty ones."""
+        market, provider, symbol, step_ms, gaps = await self._open_gaps(asset, timeframe)
+        return {
+            "asset": f"{market}:{symbol}",
+            "provider": provider.name,
+            "timeframe": timeframe,
+            "gaps": [_gap_record(start, end, step_ms) for start, end in gaps],
+            "missing_bars": sum((end - start) // step_ms + 1 for start, end in gaps),
+        }
+
+    async def fill_gaps(self, asset: str, timeframe: str, max_gaps: int = 100) -> dict[str, object]:
+        """Fetch only the missing ranges of a cached series from its provider.
+
+        Bars the provider returns go through the write-behind writer and are
+        committed before this returns; bars it does not have are
+        recorded as confirmed-empty so later scans skip them. Holes older than
+        the provider's ``history_start`` are reported as unavailable and left
+        open. Work is proportional to the size of the holes, not the length of
+        the history.
+        """
+        market, provider, symbol, step_ms, gaps = await self._open_gaps(asset, timeframe)
+        key = (provider.name, symbol, timeframe)
+        horizon = provider.history_start(timeframe)
+        horizon_ms = to_epoch_ms(horizon) if horizon is not None else None
+        filled = 0
+        confirmed_empty = 0
+        unavailable = 0
+        try:
+            for start, end in gaps[:max_gaps]:
+                if horizon_ms is not None and start < horizon_ms:
+                    # First bar of the gap the provider can still serve.
+                    first = start + -(-(horizon_ms - start) // step_ms) * step_ms
+                    unavailable += (min(first, end + step_ms) - start) // step_ms
+                    if first > end:
+                        continue
+                    start = first
+                present: list[int] = []
+                with _provider_errors(market, symbol):
+                    async for page in provider.iter_range(symbol, timeframe, from_epoch_ms(start), from_epoch_ms(end)):
+                        page = [point for point in page if start <= to_epoch_ms(point["timestamp"]) <= end]
+                        await self._writer.submit(key, OHLCVFrame.from_points(page))
+                        present.extend(to_epoch_ms(point["timestamp"]) for point in page)
+                empty = missing_runs(start, end, step_ms, present)
+                await run_in_db_thread(self.backend.record_empty_ranges, provider.name, symbol, timeframe, empty)
+                filled += len(present)
+                confirmed_empty += sum((run_end - run_start) // step_ms + 1 for run_start, run_end in empty)
+        finally:
+            await self._writer.flush()
+            self._memory.invalidate(key)
+
+        logger.info(
+            "Gap fill for %s/%s %s: %s bars filled, %s confirmed empty, %s beyond provider history",
+            market,
+            symbol,
+            timeframe,
+            filled,
+            confirmed_empty,
+            unavailable,
+        )
+        return {
+            "asset": f"{market}:{symbol}",
+            "provider": provider.name,
+            "timeframe": timeframe,
+            "gaps": min(len(gaps), max_gaps),
+            "remaining_gaps": max(0, len(gaps) - max_gaps),
+            "filled_bars": filled,
+            "confirmed_empty_bars": confirmed_empty,
+            "unavailable_bars": unavailable,
+        }
+
+    def start_stream(self, asset: str, timeframe: str) -> dict[str, object]:
+        """Subscribe a series to its provider's live feed.
+
+        The ring buffer is seeded with an incremental refresh of the cached
+        tail, after which ``get_ohlcv`` answers the series from memory.
+        """
+        market, symbol = self._resolve_market(asset)
+        provider = self.providers[market]
+        provider.validate_timeframe(timeframe)
+        if not provider.supports_streaming:
+            raise ValueError(f"Provider '{provider.name}' does not offer a streaming feed")
+
+        async def seed() -> OHLCVFrame:
+            limit = settings.live_buffer_bars
+            await self._refresh(provider, market, symbol, timeframe, limit)
+            points, _ = await self._read_window(provider.name, symbol, timeframe, limit)
+            return points
+
+        started = self._live.subscribe(provider, symbol, timeframe, seed)
+        return {"asset": f"{market}:{symbol}", "provider": provider.name, "timeframe": timeframe, "started": started}
+
+    async def stop_stream(self, asset: str, timeframe: str) -> bool:
+        market, symbol = self._resolve_market(asset)
+        return await self._live.unsubscribe((self.providers[market].name, symbol, timeframe))
+
+    def live_stats(self) -> list[dict[str, object]]:
+        return self._live.stats()
+
+    def provider_stats(self) -> dict[str, dict[str, object]]:
+        """Rate-limiter and circuit-breaker state per provider."""
+        return {
+            provider.name: {"rate_limiter": provider.rate_limiter.stats(), "circuit": provider.circuit_breaker.stats()}
+            for provider in self.providers.values()
+        }
+
+    async def _open_gaps(
+        self, asset: str, timeframe: str
+    ) -> tuple[str, BaseDataProvider, str, int, list[BarRange]]:
+        market, symbol = self._resolve_market(asset)
+        provider = self.providers[market]
+        provider.validate_timeframe(timeframe)
+        step_ms = TIMEFRAME_SECONDS[timeframe] * 1000
+        gaps = await run_in_db_thread(self.backend.find_gaps, provider.name, symbol, timeframe, step_ms)
+        if gaps:
+            empty = await run_in_db_thread(self.backend.empty_ranges, provider.name, symbol, timeframe)
+            gaps = subtract_ranges(gaps, empty, step_ms)
+        return market, provider, symbol, step_ms, gaps
+
+    def cache_stats(self) -> dict[str, int | float]:
+        """Hit/miss counters and occupancy of the in-memory candle tier, plus write-behind counters."""
+        return {**self._memory.stats(), **{f"writes_{name}": value for name, value in self._writer.stats().items()}}
+
+    async def run_maintenance(self) -> dict[str, object]:
+        """Apply retention and compact storage, then drop trimmed series from the memory tier."""
+        result = await run_in_db_thread(run_maintenance, self.backend)
+        for series in result["trimmed"]:
+            self._memory.invalidate((series["provider"], series["asset"], series["timeframe"]))
+        return result
+
+    async def _read_window(self, provider: str, asset: str, timeframe: str, limit: int) -> tuple[OHLCVFrame, datetime | None]:
+        """Return the newest ``limit`` candles and the series' last refresh time.
+
+        Hot series are answered from the memory tier without touching SQLite;
+        misses are loaded from SQLite and kept for the next request. A miss on a
+        series with queued writes waits for them so the load sees its own data.
+        The loaded window is only cached if no ingest replaced the entry while
+        the load ran; otherwise it would overwrite fresher rows.
+        """
+        key = (provider, asset, timeframe)
+        cached = self._memory.get(key, limit)
+        if cached is not None:
+            return cached
+        version = self._memory.version(key)
+        if self._writer.has_pending(key):
+            await self._writer.flush()
+        points, refreshed_at = await run_in_db_thread(self._load_window, provider, asset, timeframe, limit)
+        self._memory.put(key, points, refreshed_at, complete=len(points) < limit, version=version)
+        return points, refreshed_at
+
+    async def _resample_from_finer(
+        self,
+        provider: BaseDataProvider,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+    ) -> tuple[OHLCVFrame, str] | None:
+        """Build ``timeframe`` bars locally from a fresh, finer cached series.
+
+        A finer series qualifies when it is itself fresh, reaches back to the
+        open of the oldest requested bar and has no holes: every bucket must
+        hold all ``ratio`` source bars (the forming one up to its newest bar).
+        Coarser sources are tried first since the aggregation is exact from any
+        of them and they hold fewer rows.
+        """
+        if timeframe not in TIMEFRAME_SECONDS or timeframe in provider.session_aligned_timeframes:
+            return None
+        target_ms = TIMEFRAME_SECONDS[timeframe] * 1000
+        now_ms = to_epoch_ms(datetime.now(UTC))
+        required_start = bar_open_ms(now_ms, timeframe) - (limit - 1) * target_ms
+
+        for source_timeframe in finer_timeframes(timeframe):
+            source_ms = TIMEFRAME_SECONDS[source_timeframe] * 1000
+            ratio = target_ms // source_ms
+            source_limit = (limit + 1) * ratio
+            if source_limit > _MAX_RESAMPLE_SOURCE_ROWS:
+                continue
+            source, refreshed_at = await self._load_uncached(provider.name, symbol, source_timeframe, source_limit)
+            if not source or self._is_stale(refreshed_at, source_timeframe):
+                continue
+            frame, counts = resample(source, timeframe)
+            frame, counts = frame.tail(limit), counts[-limit:]
+            if len(frame) < limit or frame.timestamp[0] > required_start:
+                continue
+            forming = (source.timestamp[-1] - frame.timestamp[-1]) // source_ms + 1
+            if (
+                frame.timestamp[-1] - frame.timestamp[0] == (limit - 1) * target_ms
+                and counts[-1] == forming
+                and all(count == ratio for count in counts[:-1])
+            ):
+                return frame, source_timeframe
+        return None
+
+    async def _load_uncached(self, provider: str, asset: str, timeframe: str, limit: int) -> tuple[OHLCVFrame, datetime | None]:
+        """Read a window straight from storage without caching it in the memory tier.
+
+        For one-off bulk reads such as resampling sources, which would
+        otherwise evict hot series from the row-bounded LRU.
+        """
+        if self._writer.has_pending((provider, asset, timeframe)):
+            await self._writer.flush()
+        return await run_in_db_thread(self._load_window, provider, asset, timeframe, limit)
+
+    def _load_window(self, provider: str, asset: str, timeframe: str, limit: int) -> tuple[OHLCVFrame, datetime | None]:
+        points = self.backend.load(provider, asset, timeframe, limit)
+        return points, self.backend.last_refreshed_at(provider, asset, timeframe) if points else None
+
+    def _is_stale(self, refreshed_at: datetime | None, timeframe: str) -> bool:
+        if refreshed_at is None or timeframe not in TIMEFRAME_SECONDS:
+            return True
+        return is_stale(refreshed_at, timeframe, settings.cache_max_ttl_seconds)
+
+    def _start_ingest(
+        self,
+        provider: BaseDataProvider,
+        market: str,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+    ) -> tuple[asyncio.Task[int], int]:
+        """Return the in-flight ingest for a series and its window size, starting one if needed.
+
+        Concurrent cold reads, forced refreshes and stale-while-revalidate all
+        share a single task per (provider, symbol, timeframe), so only one
+        upstream call and one cache write happen; each caller then reads its
+        own ``limit`` from the cache.
+        """
+        key = (provider.name, symbol, timeframe)
+        inflight = self._inflight.get(key)
+        if inflight is None or inflight[0].done():
+            task = asyncio.create_task(self._ingest(provider, market, symbol, timeframe, limit))
+            inflight = self._inflight[key] = (task, limit)
+            task.add_done_callback(lambda done: self._finish_ingest(key, done))
+        return inflight
+
+    async def _refresh(self, provider: BaseDataProvider, market: str, symbol: str, timeframe: str, limit: int) -> None:
+        """Wait until an ingest covering at least ``limit`` bars has finished.
+
+        A running ingest for a smaller window is joined first, then followed by
+        one sized for this caller, so nobody gets a window cut to another
+        caller's limit.
+        """
+        while True:
+            task, fetched_limit = self._start_ingest(provider, market, symbol, timeframe, limit)
+            # Shielded so one caller going away does not cancel the shared fetch.
+            await asyncio.shield(task)
+            if fetched_limit >= limit:
+                return
+
+    def _finish_ingest(self, key: tuple[str, str, str], task: asyncio.Task[int]) -> None:
+        if self._inflight.get(key, (None, 0))[0] is task:
+            del self._inflight[key]
+        # Background refreshes have no awaiting caller; _ingest already logged
+        # the failure, so mark the exception as retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    async def _ingest(self, provider: BaseDataProvider, market: str, symbol: str, timeframe: str, limit: int) -> int:
+        """Fetch only candles newer than the cached tail and queue them for storage.
+
+        The newest cached bar is re-requested as well because it may still have
+        been forming when it was stored. A series that is further behind than
+        ``limit`` bars is refetched as a fresh window instead. The merged window
+        goes to the memory tier straight away; the write-behind queue persists
+        the fetched candles afterwards.
+        """
+        key = (provider.name, symbol, timeframe)
+        window, _ = await self._read_window(provider.name, symbol, timeframe, limit)
+        # A window shorter than ``limit`` is refetched whole: the cache may just
+        # hold a smaller window fetched for an earlier caller.
+        since = from_epoch_ms(window.timestamp[-1]) if len(window) >= limit else None
+        if since is not None:
+            bar_seconds = TIMEFRAME_SECONDS.get(timeframe)
+            behind = (datetime.now(UTC) - since).total_seconds()
+            if bar_seconds is None or behind / bar_seconds >= limit:
+                since = None
+
+        with _provider_errors(market, symbol):
+            fetched_points = await provider.fetch_ohlcv(symbol, timeframe, limit=limit, since=since)
+
+        logger.info(
+            "Ingested %s %s/%s %s candles (%s)",
+            len(fetched_points),
+            market,
+            symbol,
+            timeframe,
+            "incremental" if since is not None else "full window",
+        )
+        fetched = OHLCVFrame.from_points(fetched_points)
+        # Write the refreshed window through to the memory tier before queueing
+        # the write, so a failed commit's invalidation always lands after it.
+        points = window.merge(fetched).tail(limit)
+        self._memory.put(key, points, refreshed_at=datetime.now(UTC), complete=len(points) < limit)
+        await self._writer.submit(key, fetched)
+        return len(fetched_points)
+
+    async def _persist_live_bars(self, key: tuple[str, str, str], points: list[OHLCVPoint]) -> None:
+        await self._writer.submit(key, OHLCVFrame.from_points(points))
+        # The live buffer answers reads while connected; drop the memory-tier
+        # copy so reads after the feed stops reload the persisted bars.
+        self._memory.invalidate(key)
+
+
+def _gap_record(start: int, end: int, step_ms: int) -> dict[str, object]:
+    return {
+        "start": from_epoch_ms(start).isoformat(),
+        "end": from_epoch_ms(end).isoformat(),
+        "bars": (end - start) // step_ms + 1,
+    }
+
+
+def _default_backend() -> CacheBackend:
+    if settings.cache_backend == "columnar":
+        return ColumnarCacheBackend(settings.columnar_cache_dir)
+    if settings.cache_backend == "sqlite":
+        return SQLiteCacheBackend()
+    raise ValueError(f"Unknown CACHE_BACKEND '{settings.cache_backend}'. Use 'sqlite' or 'columnar'.")
+
+
+@contextmanager
+def _provider_errors(market: str, symbol: str) -> Iterator[None]:
+    """Map provider failures onto the ValueError/RuntimeError contract of the API."""
+    try:
+        yield
+    except httpx.HTTPError as exc:
+        logger.exception("Provider HTTP error for %s/%s", market, symbol)
+        raise RuntimeError("Upstream provider request failed") from exc
+    except (ValueError, CircuitOpenError):
+        raise
+    except Exception as exc:
+        logger.exception("Unexpected provider error for %s/%s", market, symbol)
+        raise RuntimeError("Unexpected error fetching market data") from exc
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+data_manager = DataManager()
@@ -1,16 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from sqlalchemy import create_engine, text
+from functools import partial
+import logging
+from typing import Any, TypeVar
+
+from sqlalchemy import Connection, create_engine, event, text
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import declarative_base, sessionmaker
 
 from config import settings
 
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
 Base = declarative_base()
-engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
+engine = create_engine(settings.database_url, connect_args={"check_same_thread": False, "timeout": 30})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_executor: ThreadPoolExecutor | None = None
+
+# SQLite DATETIME text ("YYYY-MM-DD HH:MM:SS[.ffffff]") to epoch milliseconds.
+_EPOCH_MS_SQL = "CAST(ROUND((julianday({column}) - 2440587.5) * 86400000) AS INTEGER)"
+
+# Single-column indexes from the original schema; the composite series index
+# covers every query they served and they only slow down writes.
+_LEGACY_INDEXES = (
+    "ix_ohlcv_cache_provider",
+    "ix_ohlcv_cache_asset",
+    "ix_ohlcv_cache_timeframe",
+    "ix_ohlcv_cache_timestamp",
+)
+
+
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Tune every pooled connection: WAL lets readers run alongside the writer."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_mb * 1024}")
+    cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_mb * 1024 * 1024}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+async def run_in_db_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run blocking database work on the dedicated SQLite thread pool.
+
+    Async code paths go through here so commits and cold reads never stall
+    the event loop.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.db_threads, thread_name_prefix="sqlite")
+    return await asyncio.get_running_loop().run_in_executor(_executor, partial(func, *args))
+
+
+def shutdown_db_executor() -> None:
+    """Stop the SQLite thread pool; it is recreated on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
 
 
 @contextmanager
@@ -32,9 +85,63 @@ def initialize_database() -> None:
     settings.db_path.parent.mkdir(parents=True, exist_ok=True)
     import app.data.models  # noqa: F401
 
-def initialize_database() -> None:
-    """Create database artifacts and run a tiny health query."""
-    settings.db_path.parent.mkdir(parents=True, exist_ok=True)
+    _enable_incremental_vacuum()
+
+    with engine.begin() as connection:
+        _migrate_datetime_timestamps(connection)
     Base.metadata.create_all(bind=engine)
-    with engine.connect() as connection:
+    with engine.begin() as connection:
+        # create_all skips indexes on tables that already exist.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+        for name in _LEGACY_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
         connection.execute(text("SELECT 1"))
+
+
+def _migrate_datetime_timestamps(connection: Connection) -> None:
+    """Rewrite a pre-epoch ``ohlcv_cache`` (DATETIME columns) to epoch-ms integers.
+
+    The old table is renamed aside, the current schema is created in its place
+    and every row is copied with its timestamps converted inside SQLite.
+    """
+    columns = {row[1]: row[2].upper() for row in connection.execute(text("PRAGMA table_info(ohlcv_cache)"))}
+    if columns.get("timestamp") != "DATETIME":
+        return
+    from app.data.models import OHLCVCache
+
+    logger.info("Migrating ohlcv_cache timestamps to epoch milliseconds")
+    connection.execute(text("ALTER TABLE ohlcv_cache RENAME TO ohlcv_cache_datetime"))
+    for name in ("ix_ohlcv_cache_series", *_LEGACY_INDEXES):
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    OHLCVCache.__table__.create(bind=connection)
+    connection.execute(
+        text(
+            "INSERT INTO ohlcv_cache (provider, asset, timeframe, timestamp, open, high, low, close, volume, fetched_at) "
+            f"SELECT provider, asset, timeframe, {_EPOCH_MS_SQL.format(column='timestamp')}, "
+            f"open, high, low, close, volume, {_EPOCH_MS_SQL.format(column='fetched_at')} "
+            "FROM ohlcv_cache_datetime"
+        )
+    )
+    connection.execute(text("DROP TABLE ohlcv_cache_datetime"))
+
+
+def _enable_incremental_vacuum() -> None:
+    """Switch the file to ``auto_vacuum=INCREMENTAL`` so maintenance can shrink it.
+
+    The mode only takes effect after a full VACUUM. That is free on a file with
+    no tables yet and runs here; on an existing cache it rewrites the whole
+    database, so it is left to ``python -m app.data.maintenance vacuum``.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        if connection.execute(text("PRAGMA auto_vacuum")).scalar_one() == 2:
+            return
+        if connection.execute(text("SELECT count(*) FROM sqlite_master")).scalar_one():
+            logger.warning(
+                "%s does not use incremental vacuum; run `python -m app.data.maintenance vacuum` once to enable it",
+                settings.db_path,
+            )
+            return
+        connection.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+        connection.execute(text("VACUUM"))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import itertools
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+
+OHLCVRowTuple = tuple[int, float, float, float, float, float]
+
+
+def to_epoch_ms(value: datetime | str | int | float) -> int:
+    """Convert a candle timestamp (datetime, ISO string or epoch ms) to epoch ms."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return (parsed - _EPOCH) // _MILLISECOND
+
+
+def from_epoch_ms(value: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=value)
+
+
+@dataclass(frozen=True, slots=True)
+class OHLCVFrame:
+    """Columnar OHLCV candles in ascending time order.
+
+    Timestamps are int64 epoch milliseconds and prices are float64 columns,
+    held as ``array`` objects or other read-only sequences, so strategies and
+    indicators read ``frame.close`` directly instead of pulling values out of
+    per-candle dicts. JSON records are only built at the API edge
+    via :meth:`to_records`.
+    """
+
+    timestamp: Sequence[int] = field(default_factory=lambda: array("q"))
+    open: Sequence[float] = field(default_factory=lambda: array("d"))
+    high: Sequence[float] = field(default_factory=lambda: array("d"))
+    low: Sequence[float] = field(default_factory=lambda: array("d"))
+    close: Sequence[float] = field(default_factory=lambda: array("d"))
+    volume: Sequence[float] = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[OHLCVRowTuple]) -> OHLCVFrame:
+        """Build a frame from ``(epoch_ms, open, high, low, close, volume)`` tuples."""
+        columns = list(zip(*rows, strict=True))
+        if not columns:
+            return cls()
+        timestamps, opens, highs, lows, closes, volumes = columns
+        return cls(
+            timestamp=array("q", timestamps),
+            open=array("d", opens),
+            high=array("d", highs),
+            low=array("d", lows),
+            close=array("d", closes),
+            volume=array("d", volumes),
+        )
+
+    @classmethod
+    def from_points(cls, points: Iterable[Mapping[str, object]]) -> OHLCVFrame:
+        """Build a frame from candle mappings such as provider ``OHLCVPoint`` dicts."""
+        return cls.from_rows(
+            (
+                to_epoch_ms(point["timestamp"]),
+                float(point["open"]),
+                float(point["high"]),
+                float(point["low"]),
+                float(point["close"]),
+                float(point.get("volume") or 0.0),
+            )
+            for point in points
+        )
+
+    @classmethod
+    def coerce(cls, data: OHLCVFrame | Sequence[Mapping[str, object]]) -> OHLCVFrame:
+        return data if isinstance(data, OHLCVFrame) else cls.from_points(data)
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, key: slice) -> OHLCVFrame:
+        if not isinstance(key, slice):
+            raise TypeError("OHLCVFrame only supports slicing; index the columns for single values")
+        return OHLCVFrame(
+            timestamp=self.timestamp[key],
+            open=self.open[key],
+            high=self.high[key],
+            low=self.low[key],
+            close=self.close[key],
+            volume=self.volume[key],
+        )
+
+    def tail(self, count: int) -> OHLCVFrame:
+        return self[-count:] if count > 0 else self[:0]
+
+    def split_at(self, timestamp_ms: int) -> tuple[OHLCVFrame, OHLCVFrame]:
+        """Split into candles opening at or before ``timestamp_ms`` and after it."""
+        cut = bisect_right(self.timestamp, timestamp_ms)
+        return self[:cut], self[cut:]
+
+    def rows(self) -> Iterator[OHLCVRowTuple]:
+        return zip(self.timestamp, self.open, self.high, self.low, self.close, self.volume, strict=True)
+
+    def merge(self, newer: OHLCVFrame) -> OHLCVFrame:
+        """Union with ``newer`` by open time; ``newer`` wins on duplicate bars."""
+        if not newer:
+            return self
+        cut = bisect_left(self.timestamp, newer.timestamp[0])
+        if _strictly_ascending(newer.timestamp) and set(self.timestamp[cut:]) <= set(newer.timestamp):
+            # Tail replacement, the common case for incremental refreshes.
+            return OHLCVFrame.from_rows(itertools.chain(self[:cut].rows(), newer.rows()))
+        rows = {row[0]: row for frame in (self, newer) for row in frame.rows()}
+        return OHLCVFrame.from_rows(rows[ts] for ts in sorted(rows))
+
+    def to_columns(self) -> dict[str, list]:
+        """Render JSON-ready column lists keyed by field, timestamps as epoch ms."""
+        return {
+            "timestamp": self.timestamp.tolist(),
+            "open": self.open.tolist(),
+            "high": self.high.tolist(),
+            "low": self.low.tolist(),
+            "close": self.close.tolist(),
+            "volume": self.volume.tolist(),
+        }
+
+    def to_records(self) -> list[dict[str, object]]:
+        """Render JSON-ready candle dicts with ISO-8601 UTC timestamps."""
+        return [
+            {
+                "timestamp": from_epoch_ms(ts).isoformat(),
+                "open": o,
+                "high": h,
+                "low": l,
+                "close": c,
+                "volume": v,
+            }
+            for ts, o, h, l, c, v in zip(
+                self.timestamp, self.open, self.high, self.low, self.close, self.volume, strict=True
+            )
+        ]
+
+
+def _strictly_ascending(values: Sequence[int]) -> bool:
+    return all(earlier < later for earlier, later in zip(values, values[1:]))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from app.data.base_provider import TIMEFRAME_SECONDS
+
+# Weekly candles open on Monday 00:00 UTC; the Unix epoch fell on a Thursday.
+_WEEK_OFFSET_SECONDS = 4 * 86400
+
+
+def _as_utc(moment: datetime) -> datetime:
+    return moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment.astimezone(UTC)
+
+
+def bar_open_ms(timestamp_ms: int, timeframe: str) -> int:
+    """Return the open time (epoch ms) of the bar that contains ``timestamp_ms``."""
+    step = TIMEFRAME_SECONDS[timeframe] * 1000
+    offset = _WEEK_OFFSET_SECONDS * 1000 if timeframe == "1w" else 0
+    return timestamp_ms - (timestamp_ms - offset) % step
+
+
+def bar_open(moment: datetime, timeframe: str) -> datetime:
+    """Return the open time of the bar that contains ``moment``."""
+    epoch_ms = int(_as_utc(moment).timestamp()) * 1000
+    return datetime.fromtimestamp(bar_open_ms(epoch_ms, timeframe) / 1000, tz=UTC)
+
+
+def next_bar_close(moment: datetime, timeframe: str) -> datetime:
+    """Return when the bar containing ``moment`` closes."""
+    return bar_open(moment, timeframe) + timedelta(seconds=TIMEFRAME_SECONDS[timeframe])
+
+
+def is_stale(refreshed_at: datetime, timeframe: str, max_ttl_seconds: int, now: datetime | None = None) -> bool:
+    """Decide whether a cached series needs revalidation.
+
+    A series goes stale once the bar that was forming when it was last refreshed
+    has closed, or after ``max_ttl_seconds`` so long bars (1d, 1w) still pick up
+    intra-bar price changes.
+    """
+    now = _as_utc(now or datetime.now(UTC))
+    refreshed_at = _as_utc(refreshed_at)
+    if now >= next_bar_close(refreshed_at, timeframe):
+        return True
+    return (now - refreshed_at).total_seconds() >= max_ttl_seconds
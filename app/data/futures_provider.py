@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 
 from app.data.base_provider import OHLCVPoint
@@ -12,9 +13,15 @@ class FuturesProvider(YahooChartProvider):
     """Futures OHLCV provider using Yahoo Finance public chart endpoints."""
 
     name = "futures"
+    _symbol_suffix = "=F"
 
-    async def fetch_ohlcv(self, asset: str, timeframe: str, limit: int = 300) -> list[OHLCVPoint]:
-        symbol = asset if asset.endswith("=F") else f"{asset}=F"
+    async def fetch_ohlcv(
+        self,
+        asset: str,
+        timeframe: str,
+        limit: int = 300,
+        since: datetime | None = None,
+    ) -> list[OHLCVPoint]:
+        symbol = self._symbol(asset)
         logger.info("Fetching %s %s candles from Yahoo Futures", symbol, timeframe)
-        points = await self._fetch_chart(symbol=symbol, timeframe=timeframe)
-        return points[-limit:]
+        return await self._fetch_chart(symbol=symbol, timeframe=timeframe, limit=limit, since=since)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+# Inclusive range of missing bar open times, in epoch ms.
+BarRange = tuple[int, int]
+
+
+def find_gaps(timestamps: Sequence[int], step_ms: int) -> list[BarRange]:
+    """Return runs of bar opens missing between consecutive ascending ``timestamps``.
+
+    Spacings shorter than two bars are not gaps: session-aligned bars drift by
+    an hour across DST changes without any bar being absent.
+    """
+    gaps: list[BarRange] = []
+    for previous, current in zip(timestamps, timestamps[1:]):
+        if current - previous >= 2 * step_ms:
+            gaps.append((previous + step_ms, current - step_ms))
+    return gaps
+
+
+def merge_ranges(ranges: Iterable[BarRange]) -> list[BarRange]:
+    """Sort ``ranges`` and merge the ones that overlap."""
+    merged: list[BarRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(ranges: Iterable[BarRange], covered: Sequence[BarRange], step_ms: int) -> list[BarRange]:
+    """Remove the bars of ``ranges`` that lie inside any ``covered`` range."""
+    covered = sorted(covered)
+    remaining: list[BarRange] = []
+    for start, end in ranges:
+        for covered_start, covered_end in covered:
+            if covered_end < start or covered_start > end:
+                continue
+            if covered_start > start:
+                remaining.append((start, covered_start - step_ms))
+            start = covered_end + step_ms
+            if start > end:
+                break
+        if start <= end:
+            remaining.append((start, end))
+    return remaining
+
+
+def missing_runs(start: int, end: int, step_ms: int, present: Iterable[int]) -> list[BarRange]:
+    """Runs of bar opens in ``[start, end]`` on the ``step_ms`` grid not in ``present``."""
+    present = set(present)
+    runs: list[BarRange] = []
+    run_start: int | None = None
+    for bar in range(start, end + 1, step_ms):
+        if bar in present:
+            if run_start is not None:
+                runs.append((run_start, bar - step_ms))
+                run_start = None
+        elif run_start is None:
+            run_start = bar
+    if run_start is not None:
+        runs.append((run_start, end - (end - start) % step_ms))
+    return runs
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import importlib.util
+
+import httpx
+
+from config import settings
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the pooled keep-alive client shared by every data provider.
+
+    HTTP/2 is negotiated when enabled and the optional ``h2`` package is
+    installed; otherwise connections fall back to pooled HTTP/1.1.
+    """
+    http2 = settings.http2_enabled and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(settings.http_timeout_seconds, connect=settings.http_connect_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+    )
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import logging
+
+from app.data.base_provider import BaseDataProvider, OHLCVPoint
+from app.data.frame import OHLCVFrame, to_epoch_ms
+from app.data.ring_buffer import CandleRingBuffer
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = tuple[str, str, str]
+# Brings the series up to date upstream and returns its cached tail.
+SeedFn = Callable[[], Awaitable[OHLCVFrame]]
+# Persists closed bars of one series; runs off the event loop.
+PersistFn = Callable[[SeriesKey, list[OHLCVPoint]], Awaitable[None]]
+
+_RECONNECT_BACKOFF_CAP_SECONDS = 30.0
+
+
+@dataclass
+class LiveSeries:
+    buffer: CandleRingBuffer
+    connected: bool = False
+    updates: int = 0
+    pending: list[OHLCVPoint] = field(default_factory=list)
+    task: asyncio.Task[None] | None = None
+
+
+class LiveFeed:
+    """Streams kline updates from providers into per-series ring buffers.
+
+    Each subscription owns one task that seeds its buffer from the cache,
+    then applies every streamed update in place. Bars the provider marks as
+    closed are queued and written to the cache in batches by a single flusher
+    task, so the socket reader never waits on storage. Dropped connections are
+    retried with exponential backoff and re-seeded to cover any gap.
+    """
+
+    def __init__(self, persist: PersistFn, capacity: int, flush_seconds: float) -> None:
+        self._persist = persist
+        self.capacity = capacity
+        self.flush_seconds = flush_seconds
+        self._series: dict[SeriesKey, LiveSeries] = {}
+        self._flusher: asyncio.Task[None] | None = None
+
+    def subscribe(self, provider: BaseDataProvider, symbol: str, timeframe: str, seed: SeedFn) -> bool:
+        """Start streaming a series; returns False if it was already live."""
+        key = (provider.name, symbol, timeframe)
+        if key in self._series:
+            return False
+        series = LiveSeries(buffer=CandleRingBuffer(self.capacity))
+        self._series[key] = series
+        series.task = asyncio.create_task(self._run(key, series, provider, seed))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_forever())
+        return True
+
+    async def unsubscribe(self, key: SeriesKey) -> bool:
+        series = self._series.pop(key, None)
+        if series is None:
+            return False
+        if series.task is not None:
+            series.task.cancel()
+            await asyncio.gather(series.task, return_exceptions=True)
+        await self._flush_series(key, series)
+        return True
+
+    async def aclose(self) -> None:
+        for key in list(self._series):
+            await self.unsubscribe(key)
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+
+    def window(self, key: SeriesKey, limit: int) -> OHLCVFrame | None:
+        """Newest ``limit`` bars of a connected series, or None if it cannot answer."""
+        series = self._series.get(key)
+        if series is None or not series.connected or len(series.buffer) < limit:
+            return None
+        return series.buffer.frame(limit)
+
+    def stats(self) -> list[dict[str, object]]:
+        return [
+            {
+                "provider": provider,
+                "asset": symbol,
+                "timeframe": timeframe,
+                "connected": series.connected,
+                "bars": len(series.buffer),
+                "updates": series.updates,
+                "pending": len(series.pending),
+            }
+            for (provider, symbol, timeframe), series in self._series.items()
+        ]
+
+    async def _run(self, key: SeriesKey, series: LiveSeries, provider: BaseDataProvider, seed: SeedFn) -> None:
+        _, symbol, timeframe = key
+        attempt = 0
+        while True:
+            try:
+                series.buffer.extend(await seed())
+                async for point, closed in provider.stream_klines(symbol, timeframe):
+                    series.connected = True
+                    attempt = 0
+                    series.updates += 1
+                    series.buffer.update(
+                        to_epoch_ms(point["timestamp"]),
+                        point["open"],
+                        point["high"],
+                        point["low"],
+                        point["close"],
+                        point["volume"],
+                    )
+                    if closed:
+                        series.pending.append(point)
+                logger.warning("Live feed for %s/%s %s ended; reconnecting", *key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Live feed for %s/%s %s failed", *key)
+            series.connected = False
+            delay = min(_RECONNECT_BACKOFF_CAP_SECONDS, 2.0**attempt)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _flush_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            for key, series in list(self._series.items()):
+                await self._flush_series(key, series)
+
+    async def _flush_series(self, key: SeriesKey, series: LiveSeries) -> None:
+        if not series.pending:
+            return
+        batch, series.pending = series.pending, []
+        try:
+            await self._persist(key, batch)
+        except Exception:
+            logger.exception("Failed to persist %s closed live bars for %s/%s %s", len(batch), *key)
+            series.pending[:0] = batch
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+import json
+import logging
+
+from sqlalchemy import text
+
+from app.data.base_provider import SUPPORTED_TIMEFRAMES
+from app.data.cache_backend import CacheBackend
+from app.data.database import engine, initialize_database
+from app.data.frame import to_epoch_ms
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retention(spec: str) -> dict[str, int]:
+    """Parse ``"1m=90,5m=365"`` into days kept per timeframe; others keep everything."""
+    retention: dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        timeframe, _, days = item.partition("=")
+        timeframe = timeframe.strip()
+        if timeframe not in SUPPORTED_TIMEFRAMES or not days.strip().isdigit():
+            raise ValueError(f"Invalid RETENTION_DAYS entry '{item}'; expected <timeframe>=<days>")
+        retention[timeframe] = int(days)
+    return retention
+
+
+def apply_retention(backend: CacheBackend, retention: dict[str, int], now: datetime | None = None) -> list[dict[str, object]]:
+    """Delete candles older than each timeframe's retention window.
+
+    Runs through the cache backend one series at a time and only touches
+    series whose first candle is past the cutoff. Returns the trimmed series
+    with the number of rows removed from each.
+    """
+    now = now or datetime.now(UTC)
+    trimmed: list[dict[str, object]] = []
+    for series in backend.series_stats():
+        provider, asset, timeframe = series["provider"], series["asset"], series["timeframe"]
+        if timeframe not in retention:
+            continue
+        cutoff = to_epoch_ms(now - timedelta(days=retention[timeframe]))
+        if series["first"] >= cutoff:
+            continue
+        removed = backend.delete_before(provider, asset, timeframe, cutoff)
+        if removed:
+            trimmed.append({"provider": provider, "asset": asset, "timeframe": timeframe, "rows": removed})
+    return trimmed
+
+
+def compact() -> None:
+    """Return free pages to the filesystem and refresh planner statistics."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        # The pragma frees one page per step and the sqlite3 driver only steps
+        # a statement once; executescript runs it to completion.
+        connection.connection.dbapi_connection.executescript("PRAGMA incremental_vacuum;")
+        # Sampled ANALYZE keeps this cheap on large tables.
+        connection.execute(text("PRAGMA analysis_limit=1000"))
+        connection.execute(text("ANALYZE"))
+        connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
+
+def rebuild() -> None:
+    """Full VACUUM that switches an older file to ``auto_vacuum=INCREMENTAL``.
+
+    Rewrites the whole database and blocks writers until it finishes, so it is
+    only run on request from the command line.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+        logger.info("Rebuilding %s with a full VACUUM", settings.db_path)
+        connection.execute(text("VACUUM"))
+
+
+def run_maintenance(backend: CacheBackend) -> dict[str, object]:
+    """Apply retention, then compact. Blocking; async callers use ``run_in_db_thread``.
+
+    ``trimmed`` lists the series that lost rows so callers holding them in
+    memory can drop their copies.
+    """
+    started = datetime.now(UTC)
+    retention = parse_retention(settings.retention_days)
+    trimmed = apply_retention(backend, retention, now=started)
+    compact()
+    elapsed = (datetime.now(UTC) - started).total_seconds()
+    removed = {timeframe: 0 for timeframe in retention}
+    for series in trimmed:
+        removed[series["timeframe"]] += series["rows"]
+    logger.info("Database maintenance removed %s rows in %.2fs", sum(removed.values()), elapsed)
+    return {"removed": removed, "trimmed": trimmed, "seconds": round(elapsed, 3), **database_stats(backend)}
+
+
+def database_stats(backend: CacheBackend) -> dict[str, object]:
+    """SQLite file size and free pages, plus per-series rows and bytes of the cache backend."""
+    with engine.connect() as connection:
+        page_size = connection.execute(text("PRAGMA page_size")).scalar_one()
+        page_count = connection.execute(text("PRAGMA page_count")).scalar_one()
+        freelist = connection.execute(text("PRAGMA freelist_count")).scalar_one()
+    series = backend.series_stats()
+    return {
+        "backend": backend.name,
+        "database_bytes": page_count * page_size,
+        "free_bytes": freelist * page_size,
+        "candle_bytes": sum(item["approx_bytes"] for item in series),
+        "rows": sum(item["rows"] for item in series),
+        "series": series,
+    }
+
+
+class MaintenanceScheduler:
+    """Awaits ``run`` (normally ``DataManager.run_maintenance``) every ``interval_seconds``."""
+
+    def __init__(self, interval_seconds: float, run: Callable[[], Awaitable[object]]) -> None:
+        self.interval_seconds = interval_seconds
+        self.run = run
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self.interval_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.run()
+            except Exception:
+                logger.exception("Scheduled database maintenance failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Candle database maintenance")
+    parser.add_argument(
+        "command",
+        choices=["stats", "run", "vacuum"],
+        help="report per-series sizes, apply retention and compact, or rebuild the file for incremental vacuum",
+    )
+    args = parser.parse_args()
+    initialize_database()
+    # Imported here: the data manager imports this module for its maintenance hook.
+    from app.data.data_manager import data_manager
+
+    backend = data_manager.backend
+    if args.command == "vacuum":
+        rebuild()
+    result = run_maintenance(backend) if args.command == "run" else database_stats(backend)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
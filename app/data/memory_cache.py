@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.data.frame import OHLCVFrame
+
+SeriesKey = tuple[str, str, str]
+
+
+@dataclass
+class _Entry:
+    rows: OHLCVFrame
+    refreshed_at: datetime | None
+    complete: bool
+
+
+class CandleMemoryCache:
+    """Process-local LRU tier in front of the SQLite candle cache.
+
+    Entries hold the newest window of a (provider, symbol, timeframe) series in
+    ascending order. ``complete`` marks windows that already contain the whole
+    cached series, so any ``limit`` can be answered from them. The total number
+    of rows across entries is bounded and the least recently used series are
+    evicted first. Every ``put`` or ``invalidate`` bumps the key's ``version``,
+    so a loader can tell whether the entry changed while it was reading.
+    """
+
+    def __init__(self, max_rows: int) -> None:
+        self.max_rows = max_rows
+        self._entries: OrderedDict[SeriesKey, _Entry] = OrderedDict()
+        self._rows = 0
+        self._versions: Counter[SeriesKey] = Counter()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: SeriesKey, limit: int) -> tuple[OHLCVFrame, datetime | None] | None:
+        entry = self._entries.get(key)
+        if entry is None or (len(entry.rows) < limit and not entry.complete):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.rows.tail(limit), entry.refreshed_at
+
+    def version(self, key: SeriesKey) -> int:
+        return self._versions[key]
+
+    def put(
+        self,
+        key: SeriesKey,
+        rows: OHLCVFrame,
+        refreshed_at: datetime | None,
+        complete: bool,
+        version: int | None = None,
+    ) -> None:
+        """Store a window; with ``version``, only if the key is unchanged since it was read."""
+        if version is not None and self._versions[key] != version:
+            return
+        self.invalidate(key)
+        if not rows or len(rows) > self.max_rows:
+            return
+        self._entries[key] = _Entry(rows=rows, refreshed_at=refreshed_at, complete=complete)
+        self._rows += len(rows)
+        while self._rows > self.max_rows:
+            _, evicted = self._entries.popitem(last=False)
+            self._rows -= len(evicted.rows)
+            self.evictions += 1
+
+    def invalidate(self, key: SeriesKey) -> None:
+        self._versions[key] += 1
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._rows -= len(entry.rows)
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "series": len(self._entries),
+            "rows": self._rows,
+            "max_rows": self.max_rows,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups * 100.0, 2) if lookups else 0.0,
+        }
@@ -1,29 +1,71 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy import BigInteger, Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.data.database import Base
+from app.data.frame import to_epoch_ms
+
+
+def _now_epoch_ms() -> int:
+    return to_epoch_ms(datetime.now(UTC))
 
 
 class OHLCVCache(Base):
-    """Persisted OHLCV candles for provider-backed local caching."""
+    """Persisted OHLCV candles for provider-backed local caching.
+
+    ``timestamp`` (bar open) and ``fetched_at`` are int64 epoch milliseconds in
+    UTC, so filters and ordering compare integers and nothing is parsed on read.
+    """
 
     __tablename__ = "ohlcv_cache"
     __table_args__ = (
         UniqueConstraint("provider", "asset", "timeframe", "timestamp", name="uq_ohlcv_cache_key"),
+        # Covering index for the newest-N read path: series prefix + timestamp,
+        # with the price columns appended so reads never touch the table rows.
+        Index(
+            "ix_ohlcv_cache_series",
+            "provider",
+            "asset",
+            "timeframe",
+            "timestamp",
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    provider: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
-    asset: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
-    timeframe: Mapped[str] = mapped_column(String(8), nullable=False, index=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    provider: Mapped[str] = mapped_column(String(32), nullable=False)
+    asset: Mapped[str] = mapped_column(String(64), nullable=False)
+    timeframe: Mapped[str] = mapped_column(String(8), nullable=False)
+    timestamp: Mapped[int] = mapped_column(BigInteger, nullable=False)
     open: Mapped[float] = mapped_column(Float, nullable=False)
     high: Mapped[float] = mapped_column(Float, nullable=False)
     low: Mapped[float] = mapped_column(Float, nullable=False)
     close: Mapped[float] = mapped_column(Float, nullable=False)
     volume: Mapped[float] = mapped_column(Float, nullable=False)
-    fetched_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    fetched_at: Mapped[int] = mapped_column(BigInteger, nullable=False, default=_now_epoch_ms)
+
+
+class OHLCVEmptyRange(Base):
+    """Bar ranges a provider confirmed have no candles (weekends, halts, delistings).
+
+    Gap scans skip these so closed markets are not re-requested on every pass.
+    ``start`` and ``end`` are inclusive bar opens in epoch milliseconds.
+    """
+
+    __tablename__ = "ohlcv_empty_ranges"
+    __table_args__ = (Index("ix_ohlcv_empty_ranges_series", "provider", "asset", "timeframe", "start"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    provider: Mapped[str] = mapped_column(String(32), nullable=False)
+    asset: Mapped[str] = mapped_column(String(64), nullable=False)
+    timeframe: Mapped[str] = mapped_column(String(8), nullable=False)
+    start: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    end: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    checked_at: Mapped[int] = mapped_column(BigInteger, nullable=False, default=_now_epoch_ms)
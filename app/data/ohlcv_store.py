@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from functools import lru_cache
+
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.data.database import engine
+from app.data.frame import OHLCVRowTuple, to_epoch_ms
+from app.data.models import OHLCVCache
+
+_KEY_COLUMNS = ("provider", "asset", "timeframe", "timestamp")
+_VALUE_COLUMNS = ("open", "high", "low", "close", "volume", "fetched_at")
+
+
+@lru_cache(maxsize=1)
+def _upsert_sql() -> str:
+    """Compile the SQLite upsert once; it is replayed with positional tuples."""
+    table = OHLCVCache.__table__
+    stmt = sqlite_insert(table).values({name: bindparam(name) for name in _KEY_COLUMNS + _VALUE_COLUMNS})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c[name] for name in _KEY_COLUMNS],
+        set_={name: stmt.excluded[name] for name in _VALUE_COLUMNS},
+    )
+    return str(stmt.compile(dialect=engine.dialect))
+
+
+def upsert_ohlcv(provider: str, asset: str, timeframe: str, rows: Iterable[OHLCVRowTuple]) -> int:
+    """Insert or update candles for one series with a single executemany.
+
+    ``rows`` are plain ``(timestamp, open, high, low, close, volume)`` tuples with
+    epoch-millisecond timestamps. Conflicts on ``uq_ohlcv_cache_key`` overwrite the stored
+    prices, so re-sending the still-forming bar updates it in place. No ORM
+    objects are created. Returns the number of rows written.
+    """
+    return upsert_ohlcv_many([(provider, asset, timeframe, rows)])
+
+
+def upsert_ohlcv_many(series: Iterable[tuple[str, str, str, Iterable[OHLCVRowTuple]]]) -> int:
+    """Upsert several series in one transaction and one executemany."""
+    fetched_at = to_epoch_ms(datetime.now(UTC))
+    params = [
+        (provider, asset, timeframe, timestamp, open_, high, low, close, volume, fetched_at)
+        for provider, asset, timeframe, rows in series
+        for timestamp, open_, high, low, close, volume in rows
+    ]
+    if not params:
+        return 0
+    with engine.begin() as connection:
+        connection.exec_driver_sql(_upsert_sql(), params)
+    return len(params)
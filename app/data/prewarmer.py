@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import logging
+
+from app.data.data_manager import DataManager
+from app.data.freshness import next_bar_close
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _WatchedSeries:
+    asset: str
+    timeframe: str
+    provider: str
+    due_at: datetime
+    bar_close: datetime
+    refreshed_at: datetime | None = None
+    lag_seconds: float | None = None
+    failures: int = 0
+
+
+class WatchlistPrewarmer:
+    """Refreshes a watchlist of series right after each of their bars closes.
+
+    Every series is due ``delay`` after its bar boundary (or after the cache
+    TTL for long bars, whichever comes first). Each provider has its own lane
+    task that refreshes its due series one after another, ``stagger`` apart,
+    and then sleeps until its next one is due, so a slow provider never holds
+    up another. Lag is measured from bar close to the moment the refreshed
+    candles are cached.
+    """
+
+    def __init__(
+        self,
+        manager: DataManager,
+        watchlist: list[tuple[str, str]],
+        delay_seconds: float,
+        stagger_seconds: float,
+    ) -> None:
+        self.manager = manager
+        self.delay = timedelta(seconds=delay_seconds)
+        self.stagger_seconds = stagger_seconds
+        self._tasks: list[asyncio.Task[None]] = []
+        now = datetime.now(UTC)
+        self._series: list[_WatchedSeries] = []
+        for asset, timeframe in watchlist:
+            try:
+                provider = manager.provider_for(asset)
+                provider.validate_timeframe(timeframe)
+            except ValueError:
+                logger.exception("Ignoring invalid watchlist entry %s@%s", asset, timeframe)
+                continue
+            # Warm everything once at startup, then follow the bar boundaries.
+            self._series.append(_WatchedSeries(asset, timeframe, provider.name, due_at=now, bar_close=now))
+
+    @classmethod
+    def from_settings(cls, manager: DataManager) -> WatchlistPrewarmer:
+        assets = [item.strip() for item in settings.watchlist_assets.split(",") if item.strip()]
+        timeframes = [item.strip() for item in settings.watchlist_timeframes.split(",") if item.strip()]
+        return cls(
+            manager,
+            [(asset, timeframe) for asset in assets for timeframe in timeframes],
+            delay_seconds=settings.prewarm_delay_seconds,
+            stagger_seconds=settings.prewarm_stagger_seconds,
+        )
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        lanes: dict[str, list[_WatchedSeries]] = defaultdict(list)
+        for series in self._series:
+            lanes[series.provider].append(series)
+        self._tasks = [asyncio.create_task(self._run_lane(lane)) for lane in lanes.values()]
+
+    async def aclose(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict[str, object]:
+        """Scheduler health: how far behind schedule it runs and per-series lag."""
+        now = datetime.now(UTC)
+        overdue = [(now - series.due_at).total_seconds() for series in self._series if series.due_at <= now]
+        lags = [series.lag_seconds for series in self._series if series.lag_seconds is not None]
+        return {
+            "running": bool(self._tasks) and all(not task.done() for task in self._tasks),
+            "series": len(self._series),
+            "overdue": len(overdue),
+            "behind_seconds": round(max(overdue, default=0.0), 3),
+            "max_lag_seconds": round(max(lags, default=0.0), 3),
+            "watchlist": [
+                {
+                    "asset": series.asset,
+                    "timeframe": series.timeframe,
+                    "next_refresh": series.due_at.isoformat(),
+                    "last_refresh": series.refreshed_at.isoformat() if series.refreshed_at else None,
+                    "lag_seconds": round(series.lag_seconds, 3) if series.lag_seconds is not None else None,
+                    "failures": series.failures,
+                }
+                for series in self._series
+            ],
+        }
+
+    async def _run_lane(self, lane: list[_WatchedSeries]) -> None:
+        while True:
+            now = datetime.now(UTC)
+            due = sorted((series for series in lane if series.due_at <= now), key=lambda item: item.due_at)
+            if not due:
+                wake_at = min(series.due_at for series in lane)
+                await asyncio.sleep((wake_at - now).total_seconds())
+                continue
+            for index, series in enumerate(due):
+                if index:
+                    await asyncio.sleep(self.stagger_seconds)
+                await self._refresh(series)
+
+    async def _refresh(self, series: _WatchedSeries) -> None:
+        try:
+            result = await self.manager.get_ohlcv(series.asset, series.timeframe, refresh=True)
+            if result["source"] == "stale":
+                raise RuntimeError("Upstream unavailable; only stale candles were served")
+        except Exception:
+            series.failures += 1
+            logger.warning("Pre-warm of %s %s failed", series.asset, series.timeframe, exc_info=True)
+        else:
+            series.refreshed_at = datetime.now(UTC)
+            series.lag_seconds = (series.refreshed_at - series.bar_close).total_seconds()
+        self._schedule(series)
+
+    def _schedule(self, series: _WatchedSeries) -> None:
+        now = datetime.now(UTC)
+        series.bar_close = min(next_bar_close(now, series.timeframe), now + timedelta(seconds=settings.cache_max_ttl_seconds))
+        series.due_at = series.bar_close + self.delay
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+
+class AdaptiveRateLimiter:
+    """Token bucket that paces one provider's upstream requests.
+
+    Tokens refill at ``rate`` per second up to ``burst``. ``acquire`` debits the
+    bucket immediately and sleeps off any deficit, so callers are admitted in
+    arrival order without a lock and a burst of callers is spread evenly.
+
+    The bucket adapts to what the provider reports: ``sync_remaining`` clamps it
+    to the budget an upstream header says is left, and ``throttled`` halves the
+    rate and pauses everyone after a 429. Each success restores a little rate
+    until the configured ceiling is reached again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        min_rate: float | None = None,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+    ) -> None:
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.rate = rate
+        self.burst = burst
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.throttle_count = 0
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self, weight: float = 1.0) -> None:
+        """Wait until ``weight`` tokens are available (or owed) and take them."""
+        now = self._refill()
+        self._tokens -= weight
+        delay = max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def sync_remaining(self, remaining: float) -> None:
+        """Never hold more tokens than the upstream says are left in its window."""
+        self._refill()
+        self._tokens = min(self._tokens, remaining)
+
+    def succeeded(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def throttled(self, attempt: int, retry_after: float | None = None) -> float:
+        """Back off after a 429 and return how long new requests are paused.
+
+        ``Retry-After`` wins when the provider sends one; otherwise the pause is
+        exponential in ``attempt`` with jitter so parked callers do not retry
+        in lockstep.
+        """
+        now = self._refill()
+        self.throttle_count += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after is None:
+            ceiling = min(self.backoff_cap, self.backoff_base * 2**attempt)
+            retry_after = random.uniform(ceiling / 2, ceiling)
+        self._paused_until = max(self._paused_until, now + retry_after)
+        return retry_after
+
+    def stats(self) -> dict[str, float]:
+        self._refill()
+        return {
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "tokens": round(self._tokens, 3),
+            "throttled": self.throttle_count,
+        }
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from array import array
+from itertools import compress, repeat
+from operator import ne, sub
+
+from app.data.base_provider import TIMEFRAME_SECONDS
+from app.data.frame import OHLCVFrame
+from app.data.freshness import bar_open_ms
+
+
+def finer_timeframes(timeframe: str) -> list[str]:
+    """Timeframes whose bars tile ``timeframe`` exactly, coarsest first."""
+    target = TIMEFRAME_SECONDS[timeframe]
+    candidates = [name for name, seconds in TIMEFRAME_SECONDS.items() if seconds < target and target % seconds == 0]
+    return sorted(candidates, key=TIMEFRAME_SECONDS.__getitem__, reverse=True)
+
+
+def resample(frame: OHLCVFrame, timeframe: str) -> tuple[OHLCVFrame, array]:
+    """Aggregate a finer-grained frame into ``timeframe`` bars.
+
+    A group-by over the column arrays: bucket keys and group boundaries are
+    computed column-wise, then each bucket is reduced with C-level slices
+    (first open, max high, min low, last close, summed volume), so Python
+    only loops once per output bar. A leading bucket that the source only
+    covers part of is dropped. Returns the bars with the number of source
+    candles in each, so callers can reject buckets with holes.
+    """
+    if not frame:
+        return OHLCVFrame(), array("q")
+    buckets = list(map(bar_open_ms, frame.timestamp, repeat(timeframe)))
+    starts = [0, *compress(range(1, len(buckets)), map(ne, buckets[1:], buckets))]
+    ends = [*starts[1:], len(buckets)]
+    if buckets[0] != frame.timestamp[0]:
+        starts, ends = starts[1:], ends[1:]
+    groups = list(zip(starts, ends))
+    result = OHLCVFrame(
+        timestamp=array("q", map(buckets.__getitem__, starts)),
+        open=array("d", map(frame.open.__getitem__, starts)),
+        high=array("d", [max(frame.high[start:end]) for start, end in groups]),
+        low=array("d", [min(frame.low[start:end]) for start, end in groups]),
+        close=array("d", [frame.close[end - 1] for end in ends]),
+        volume=array("d", [sum(frame.volume[start:end]) for start, end in groups]),
+    )
+    return result, array("q", map(sub, ends, starts))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from array import array
+
+from app.data.frame import OHLCVFrame
+
+
+class CandleRingBuffer:
+    """Fixed-capacity, preallocated window of the newest candles of one series.
+
+    Updates for the bar that is still forming overwrite the newest slot, a new
+    open time advances the head and overwrites the oldest bar once the buffer
+    is full, and out-of-order updates for older bars are ignored. Nothing is
+    allocated per update.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        self._timestamp = array("q", bytes(8 * capacity))
+        self._columns = tuple(array("d", bytes(8 * capacity)) for _ in range(5))
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> int | None:
+        return self._timestamp[(self._head - 1) % self.capacity] if self._size else None
+
+    def update(self, timestamp_ms: int, o: float, h: float, l: float, c: float, v: float) -> bool:
+        """Apply one candle update; returns False if it was older than the newest bar."""
+        last = self.last_timestamp
+        if last is not None and timestamp_ms < last:
+            return False
+        if last is None or timestamp_ms > last:
+            slot = self._head
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+        else:
+            slot = (self._head - 1) % self.capacity
+        self._timestamp[slot] = timestamp_ms
+        for column, value in zip(self._columns, (o, h, l, c, v)):
+            column[slot] = value
+        return True
+
+    def extend(self, frame: OHLCVFrame) -> None:
+        for row in zip(frame.timestamp, frame.open, frame.high, frame.low, frame.close, frame.volume):
+            self.update(*row)
+
+    def frame(self, limit: int) -> OHLCVFrame:
+        """Copy out the newest ``limit`` candles in ascending order."""
+        count = min(max(limit, 0), self._size)
+        start = (self._head - count) % self.capacity
+        stop = start + count
+
+        def window(column: array) -> array:
+            if stop <= self.capacity:
+                return column[start:stop]
+            return column[start:] + column[: stop - self.capacity]
+
+        opens, highs, lows, closes, volumes = (window(column) for column in self._columns)
+        return OHLCVFrame(
+            timestamp=window(self._timestamp), open=opens, high=highs, low=lows, close=closes, volume=volumes
+        )
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select, text
+
+from app.data.cache_backend import CacheBackend
+from app.data.database import engine, get_db_session
+from app.data.frame import OHLCVFrame, from_epoch_ms
+from app.data.gaps import BarRange, merge_ranges
+from app.data.models import OHLCVCache, OHLCVEmptyRange
+from app.data.ohlcv_store import upsert_ohlcv, upsert_ohlcv_many
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Row-per-candle cache in the ``ohlcv_cache`` table."""
+
+    name = "sqlite"
+
+    def load(self, provider: str, asset: str, timeframe: str, limit: int) -> OHLCVFrame:
+        """Ordering and the limit run in SQLite against ``ix_ohlcv_cache_series``
+        so the cost does not grow with the length of the stored history.
+        """
+        stmt = (
+            select(
+                OHLCVCache.timestamp,
+                OHLCVCache.open,
+                OHLCVCache.high,
+                OHLCVCache.low,
+                OHLCVCache.close,
+                OHLCVCache.volume,
+            )
+            .where(OHLCVCache.provider == provider)
+            .where(OHLCVCache.asset == asset)
+            .where(OHLCVCache.timeframe == timeframe)
+            .order_by(OHLCVCache.timestamp.desc())
+            .limit(limit)
+        )
+        with get_db_session() as session:
+            rows = session.execute(stmt).all()
+
+        return OHLCVFrame.from_rows(reversed(rows))
+
+    def last_refreshed_at(self, provider: str, asset: str, timeframe: str) -> datetime | None:
+        """Every ingest re-upserts the newest bar, so its ``fetched_at`` is the
+        time of the latest refresh and can be read with a single index seek.
+        """
+        stmt = (
+            select(OHLCVCache.fetched_at)
+            .where(OHLCVCache.provider == provider)
+            .where(OHLCVCache.asset == asset)
+            .where(OHLCVCache.timeframe == timeframe)
+            .order_by(OHLCVCache.timestamp.desc())
+            .limit(1)
+        )
+        with get_db_session() as session:
+            refreshed_at = session.execute(stmt).scalar_one_or_none()
+        return from_epoch_ms(refreshed_at) if refreshed_at is not None else None
+
+    def upsert(self, provider: str, asset: str, timeframe: str, frame: OHLCVFrame) -> int:
+        return upsert_ohlcv(provider, asset, timeframe, frame.rows())
+
+    def upsert_many(self, batch: Mapping[tuple[str, str, str], OHLCVFrame]) -> int:
+        return upsert_ohlcv_many((provider, asset, timeframe, frame.rows()) for (provider, asset, timeframe), frame in batch.items())
+
+    def find_gaps(self, provider: str, asset: str, timeframe: str, step_ms: int) -> list[BarRange]:
+        """Same rule as :func:`app.data.gaps.find_gaps`, evaluated inside SQLite
+        over the covering index so only the holes travel back to Python.
+        """
+        stmt = text(
+            "SELECT previous, timestamp FROM ("
+            " SELECT timestamp, LAG(timestamp) OVER (ORDER BY timestamp) AS previous FROM ohlcv_cache"
+            " WHERE provider = :provider AND asset = :asset AND timeframe = :timeframe"
+            ") WHERE timestamp - previous >= 2 * :step"
+        )
+        params = {"provider": provider, "asset": asset, "timeframe": timeframe, "step": step_ms}
+        with engine.connect() as connection:
+            rows = connection.execute(stmt, params).all()
+        return [(previous + step_ms, current - step_ms) for previous, current in rows]
+
+    def empty_ranges(self, provider: str, asset: str, timeframe: str) -> list[BarRange]:
+        stmt = (
+            select(OHLCVEmptyRange.start, OHLCVEmptyRange.end)
+            .where(OHLCVEmptyRange.provider == provider)
+            .where(OHLCVEmptyRange.asset == asset)
+            .where(OHLCVEmptyRange.timeframe == timeframe)
+            .order_by(OHLCVEmptyRange.start)
+        )
+        with get_db_session() as session:
+            return [(start, end) for start, end in session.execute(stmt)]
+
+    def record_empty_ranges(self, provider: str, asset: str, timeframe: str, ranges: list[BarRange]) -> None:
+        """Merge ``ranges`` into the stored ones so re-scanning a hole adds no rows."""
+        if not ranges:
+            return
+        series = (
+            (OHLCVEmptyRange.provider == provider)
+            & (OHLCVEmptyRange.asset == asset)
+            & (OHLCVEmptyRange.timeframe == timeframe)
+        )
+        with engine.begin() as connection:
+            stored = [
+                (start, end) for start, end in connection.execute(select(OHLCVEmptyRange.start, OHLCVEmptyRange.end).where(series))
+            ]
+            merged = merge_ranges([*stored, *ranges])
+            if merged == sorted(stored):
+                return
+            connection.execute(delete(OHLCVEmptyRange).where(series))
+            connection.execute(
+                insert(OHLCVEmptyRange),
+                [
+                    {"provider": provider, "asset": asset, "timeframe": timeframe, "start": start, "end": end}
+                    for start, end in merged
+                ],
+            )
+
+    def delete_before(self, provider: str, asset: str, timeframe: str, cutoff_ms: int) -> int:
+        """A range seek on the series index, so trimming cost follows the rows removed.
+
+        Empty ranges that end before the cutoff go too; nothing can scan them again.
+        """
+        params = {"provider": provider, "asset": asset, "timeframe": timeframe, "cutoff": cutoff_ms}
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "DELETE FROM ohlcv_empty_ranges WHERE provider = :provider AND asset = :asset "
+                    'AND timeframe = :timeframe AND "end" < :cutoff'
+                ),
+                params,
+            )
+            return connection.execute(
+                text(
+                    "DELETE FROM ohlcv_cache WHERE provider = :provider AND asset = :asset "
+                    "AND timeframe = :timeframe AND timestamp < :cutoff"
+                ),
+                params,
+            ).rowcount
+
+    def series_stats(self) -> list[dict[str, object]]:
+        """Bytes split the table and index footprint (measured through ``dbstat``
+        when SQLite provides it) in proportion to row counts.
+        """
+        with engine.connect() as connection:
+            try:
+                candle_bytes = connection.execute(
+                    text(
+                        "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name IN "
+                        "(SELECT name FROM sqlite_master WHERE tbl_name = 'ohlcv_cache')"
+                    )
+                ).scalar_one()
+            except Exception:
+                page_size = connection.execute(text("PRAGMA page_size")).scalar_one()
+                page_count = connection.execute(text("PRAGMA page_count")).scalar_one()
+                freelist = connection.execute(text("PRAGMA freelist_count")).scalar_one()
+                candle_bytes = (page_count - freelist) * page_size
+            rows = connection.execute(
+                text(
+                    "SELECT provider, asset, timeframe, COUNT(*), MIN(timestamp), MAX(timestamp) "
+                    "FROM ohlcv_cache GROUP BY provider, asset, timeframe ORDER BY provider, asset, timeframe"
+                )
+            ).all()
+
+        total_rows = sum(row[3] for row in rows)
+        bytes_per_row = candle_bytes / total_rows if total_rows else 0.0
+        return [
+            {
+                "provider": provider,
+                "asset": asset,
+                "timeframe": timeframe,
+                "rows": count,
+                "approx_bytes": round(count * bytes_per_row),
+                "first": first,
+                "last": last,
+            }
+            for provider, asset, timeframe, count, first, last in rows
+        ]
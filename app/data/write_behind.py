@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Iterable
+import logging
+
+from app.data.cache_backend import CacheBackend
+from app.data.database import run_in_db_thread
+from app.data.frame import OHLCVFrame
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = tuple[str, str, str]
+
+
+class WriteBehindWriter:
+    """Single background writer that persists candle frames off the request path.
+
+    Callers ``submit`` frames and continue without waiting for storage. The
+    writer drains the queue, merges everything queued for the same series
+    (newer bars win) and commits each drained batch through
+    ``CacheBackend.upsert_many``, so there is only ever one SQLite writer and
+    one transaction per batch. A failed commit is retried with backoff; once
+    ``max_attempts`` are spent, ``on_failure`` is called for every series in
+    the batch so callers can drop state that assumed the write landed. At most
+    ``max_pending`` frames wait in the queue; ``submit`` blocks beyond that.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        on_failure: Callable[[SeriesKey], None] | None = None,
+        max_pending: int = 10_000,
+        max_batch: int = 256,
+        max_attempts: int = 3,
+        retry_seconds: float = 0.5,
+    ) -> None:
+        self.backend = backend
+        self.on_failure = on_failure
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.batches = 0
+        self.rows = 0
+        self.retries = 0
+        self.failures = 0
+        self._queue: asyncio.Queue[tuple[SeriesKey, OHLCVFrame]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._pending_series: Counter[SeriesKey] = Counter()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def has_pending(self, key: SeriesKey) -> bool:
+        return self._pending_series[key] > 0
+
+    async def submit(self, key: SeriesKey, frame: OHLCVFrame) -> None:
+        """Queue ``frame`` for storage; waits only while the queue is full."""
+        if not frame:
+            return
+        if self._task is None or self._task.get_loop() is not asyncio.get_running_loop():
+            # The writer belongs to the loop that first submitted; a caller on
+            # another loop (e.g. a one-off ``asyncio.run`` script) gets its own.
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = asyncio.create_task(self._run(self._queue))
+        self._pending_series[key] += 1
+        try:
+            await self._queue.put((key, frame))
+        except BaseException:
+            self._release([key])
+            raise
+
+    async def flush(self) -> None:
+        """Wait until everything submitted so far has been committed (or failed)."""
+        if self._task is not None and self._task.get_loop() is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        await self.flush()
+        task, self._task, self._queue = self._task, None, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.pending,
+            "batches": self.batches,
+            "rows": self.rows,
+            "retries": self.retries,
+            "failures": self.failures,
+        }
+
+    async def _run(self, queue: asyncio.Queue[tuple[SeriesKey, OHLCVFrame]]) -> None:
+        while True:
+            items = [await queue.get()]
+            while len(items) < self.max_batch and not queue.empty():
+                items.append(queue.get_nowait())
+            batch: dict[SeriesKey, OHLCVFrame] = {}
+            for key, frame in items:
+                batch[key] = batch[key].merge(frame) if key in batch else frame
+            try:
+                await self._commit(batch)
+            finally:
+                self._release(key for key, _ in items)
+                for _ in items:
+                    queue.task_done()
+
+    async def _commit(self, batch: dict[SeriesKey, OHLCVFrame]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self.rows += await run_in_db_thread(self.backend.upsert_many, batch)
+                self.batches += 1
+                return
+            except Exception:
+                if attempt < self.max_attempts:
+                    self.retries += 1
+                    logger.warning("Write-behind commit of %s series failed; retrying", len(batch), exc_info=True)
+                    await asyncio.sleep(self.retry_seconds * attempt)
+                    continue
+                self.failures += 1
+                logger.exception("Write-behind commit of %s series failed; dropping the batch", len(batch))
+        if self.on_failure is not None:
+            for key in batch:
+                self.on_failure(key)
+
+    def _release(self, keys: Iterable[SeriesKey]) -> None:
+        for key in keys:
+            self._pending_series[key] -= 1
+            if not self._pending_series[key]:
+                del self._pending_series[key]
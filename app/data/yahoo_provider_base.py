@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from itertools import chain, repeat
 import logging
 
-import httpx
-
-from app.data.base_provider import BaseDataProvider, OHLCVPoint
+from app.data.base_provider import TIMEFRAME_SECONDS, BaseDataProvider, OHLCVPoint
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,11 @@ class YahooChartProvider(BaseDataProvider):
     """Common Yahoo Finance chart API parser for OHLCV data."""
 
     _base_url = "https://query1.finance.yahoo.com/v8/finance/chart"
+    session_aligned_timeframes = frozenset({"1d", "1w"})
+    # Yahoo publishes no quota and answers overload with bare 429s, so start
+    # modestly and let the limiter back off from there.
+    rate_limit_per_second = 4.0
+    rate_limit_burst = 8.0
     _timeframe_map = {
         "1m": "1m",
         "5m": "5m",
@@ -21,27 +26,75 @@ class YahooChartProvider(BaseDataProvider):
         "1d": "1d",
         "1w": "1wk",
     }
-    _range_map = {
-        "1m": "7d",
-        "5m": "30d",
-        "1h": "730d",
-        "1d": "10y",
-        "1w": "10y",
+    # Deepest history Yahoo serves per interval (intraday bars expire).
+    _max_lookback = {
+        "1m": timedelta(days=7),
+        "5m": timedelta(days=30),
+        "1h": timedelta(days=730),
+        "1d": timedelta(days=3650),
+        "1w": timedelta(days=3650),
     }
+    # Weekends and holidays leave calendar time without bars, so a window of
+    # ``limit`` bars is widened by this factor plus one spare weekend.
+    _calendar_padding = 1.5
+    _weekend = timedelta(days=3)
+
+    _symbol_suffix = ""
+
+    def history_start(self, timeframe: str) -> datetime | None:
+        # One spare day so a bar right at the edge is not expired by the time
+        # the chart request computes its own ``oldest``.
+        return datetime.now(UTC) - self._max_lookback[timeframe] + timedelta(days=1)
+
+    def _symbol(self, asset: str) -> str:
+        return asset if asset.endswith(self._symbol_suffix) else f"{asset}{self._symbol_suffix}"
 
-    async def _fetch_chart(self, symbol: str, timeframe: str) -> list[OHLCVPoint]:
+    async def iter_range(
+        self,
+        asset: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[list[OHLCVPoint]]:
+        """Fetch ``[start, end]`` as one chart window ending at ``end``."""
         self.validate_timeframe(timeframe)
+        bars = int((end - start).total_seconds() // TIMEFRAME_SECONDS[timeframe]) + 1
+        points = await self._fetch_chart(self._symbol(asset), timeframe, limit=bars, since=start, until=end)
+        yield [point for point in points if point["timestamp"] <= end]
+
+    async def _fetch_chart(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[OHLCVPoint]:
+        """Fetch candles via an explicit ``period1``/``period2`` window.
+
+        The window starts at ``since`` for incremental refreshes, otherwise it
+        spans roughly ``limit`` bars back from now, so Yahoo never serves more
+        history than the caller keeps. ``until`` ends it early for range reads.
+        """
+        self.validate_timeframe(timeframe)
+        now = datetime.now(UTC)
+        end = min(until, now) if until is not None else now
+        oldest = now - self._max_lookback[timeframe]
+        if since is None:
+            span = timedelta(seconds=TIMEFRAME_SECONDS[timeframe] * limit * self._calendar_padding) + self._weekend
+            start = end - span
+        else:
+            start = since
         params = {
             "interval": self._timeframe_map[timeframe],
-            "range": self._range_map[timeframe],
+            "period1": int(max(start, oldest).timestamp()),
+            # period2 is exclusive; extend by one bar so ``until`` itself is included.
+            "period2": int(end.timestamp()) + TIMEFRAME_SECONDS[timeframe],
             "includePrePost": "false",
             "events": "div,splits",
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(f"{self._base_url}/{symbol}", params=params)
-            response.raise_for_status()
-            payload = response.json()
+        payload = await self._get_json(f"{self._base_url}/{symbol}", params)
 
         result = payload.get("chart", {}).get("result")
         if not result:
@@ -50,29 +103,28 @@ class YahooChartProvider(BaseDataProvider):
         chart = result[0]
         timestamps = chart.get("timestamp") or []
         quote = chart.get("indicators", {}).get("quote", [{}])[0]
-        opens = quote.get("open") or []
-        highs = quote.get("high") or []
-        lows = quote.get("low") or []
-        closes = quote.get("close") or []
-        volumes = quote.get("volume") or []
-
-        points: list[OHLCVPoint] = []
-        for idx, ts in enumerate(timestamps):
-            o = opens[idx] if idx < len(opens) else None
-            h = highs[idx] if idx < len(highs) else None
-            l = lows[idx] if idx < len(lows) else None
-            c = closes[idx] if idx < len(closes) else None
-            v = volumes[idx] if idx < len(volumes) else 0
-            if None in (o, h, l, c):
-                continue
-            points.append(
-                {
-                    "timestamp": datetime.fromtimestamp(ts, tz=UTC),
-                    "open": float(o),
-                    "high": float(h),
-                    "low": float(l),
-                    "close": float(c),
-                    "volume": float(v or 0.0),
-                }
-            )
-        return points
+        columns = zip(
+            timestamps,
+            quote.get("open") or (),
+            quote.get("high") or (),
+            quote.get("low") or (),
+            quote.get("close") or (),
+            # Volume may be absent or shorter than the prices; missing entries are 0.
+            chain(quote.get("volume") or (), repeat(0)),
+        )
+        # Yahoo pads halted or not-yet-traded bars with nulls; skip those rows.
+        points: list[OHLCVPoint] = [
+            {
+                "timestamp": datetime.fromtimestamp(ts, tz=UTC),
+                "open": float(o),
+                "high": float(h),
+                "low": float(l),
+                "close": float(c),
+                "volume": float(v or 0.0),
+            }
+            for ts, o, h, l, c, v in columns
+            if o is not None and h is not None and l is not None and c is not None
+        ]
+        if since is not None:
+            points = [point for point in points if point["timestamp"] >= since]
+        return points[-limit:]
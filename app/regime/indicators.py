@@ -1,26 +1,21 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from itertools import accumulate, compress, repeat
 from math import log, sqrt
+from operator import add, le, mul, sub, truediv
 from statistics import mean, pstdev
 
 
-@dataclass(frozen=True)
-class Candle:
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: float
-
-
-def _returns(closes: list[float]) -> list[float]:
+def _returns(closes: Sequence[float]) -> list[float]:
     if len(closes) < 2:
         return []
     return [(closes[i] - closes[i - 1]) / closes[i - 1] for i in range(1, len(closes)) if closes[i - 1] != 0]
 
 
-def rolling_volatility(closes: list[float], window: int = 20) -> float:
+def rolling_volatility(closes: Sequence[float], window: int = 20) -> float:
     """Compute annualized rolling volatility proxy from returns."""
     rets = _returns(closes)
     if len(rets) < 2:
@@ -30,7 +25,7 @@ def rolling_volatility(closes: list[float], window: int = 20) -> float:
     return sigma * sqrt(252)
 
 
-def rsi(closes: list[float], period: int = 14) -> float:
+def rsi(closes: Sequence[float], period: int = 14) -> float:
     if len(closes) <= period:
         return 50.0
     gains: list[float] = []
@@ -47,20 +42,21 @@ def rsi(closes: list[float], period: int = 14) -> float:
     return 100.0 - (100.0 / (1.0 + rs))
 
 
-def adx(candles: list[Candle], period: int = 14) -> float:
-    if len(candles) <= period + 1:
+def adx(highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], period: int = 14) -> float:
+    if len(closes) <= period + 1:
         return 10.0
 
     trs: list[float] = []
     plus_dm: list[float] = []
     minus_dm: list[float] = []
 
-    for i in range(1, len(candles)):
-        current = candles[i]
-        prev = candles[i - 1]
-        tr = max(current.high - current.low, abs(current.high - prev.close), abs(current.low - prev.close))
-        up_move = current.high - prev.high
-        down_move = prev.low - current.low
+    for i in range(1, len(closes)):
+        high = highs[i]
+        low = lows[i]
+        prev_close = closes[i - 1]
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        up_move = high - highs[i - 1]
+        down_move = lows[i - 1] - low
         pdm = up_move if up_move > down_move and up_move > 0 else 0.0
         mdm = down_move if down_move > up_move and down_move > 0 else 0.0
         trs.append(tr)
@@ -80,7 +76,7 @@ def adx(candles: list[Candle], period: int = 14) -> float:
     return dx
 
 
-def volatility_clustering(closes: list[float], window: int = 30) -> float:
+def volatility_clustering(closes: Sequence[float], window: int = 30) -> float:
     """Absolute-return lag-1 autocorrelation proxy for volatility clustering."""
     rets = [abs(x) for x in _returns(closes)][-window:]
     if len(rets) < 3:
@@ -98,7 +94,7 @@ def volatility_clustering(closes: list[float], window: int = 30) -> float:
     return numerator / denominator
 
 
-def hurst_exponent(closes: list[float], max_lag: int = 20) -> float:
+def hurst_exponent(closes: Sequence[float], max_lag: int = 20) -> float:
     """Estimate the Hurst exponent (optional signal)."""
     if len(closes) < max_lag + 2:
         return 0.5
@@ -125,3 +121,205 @@ def hurst_exponent(closes: list[float], max_lag: int = 20) -> float:
         return 0.5
     slope = numerator / denominator
     return max(0.0, min(1.0, slope * 2))
+
+
+# Rolling engine: the functions below return one value per ``span``-bar window
+# (window ``k`` covers bars ``[k, k + span)``) and match the single-window
+# functions above called on that slice. Window sums come from prefix sums, so
+# a whole history costs a few passes instead of one indicator run per bar.
+
+# Windows whose variance is this small relative to their mean square are
+# recomputed exactly; prefix-sum cancellation cannot tell them from zero.
+_DEGENERATE_VARIANCE = 1e-10
+# Likewise when the prefix sum of squares outgrows the window's own by this
+# factor (a huge return off a near-zero close earlier in the series): the
+# window difference is then mostly rounding error.
+_CANCELLATION_RATIO = 1e8
+_TINY = 1e-300
+
+
+@dataclass(frozen=True)
+class RollingIndicators:
+    volatility: list[float]
+    adx: list[float]
+    rsi: list[float]
+    clustering: list[float]
+    hurst: list[float]
+
+
+def rolling_indicators(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], span: int
+) -> RollingIndicators:
+    """Every regime indicator for each ``span``-bar window of the series."""
+    return RollingIndicators(
+        volatility=rolling_volatility_series(closes, span),
+        adx=adx_series(highs, lows, closes, span),
+        rsi=rsi_series(closes, span),
+        clustering=volatility_clustering_series(closes, span),
+        hurst=hurst_exponent_series(closes, span),
+    )
+
+
+def _prefix(values: Iterable[float]) -> list[float]:
+    return list(accumulate(values, initial=0.0))
+
+
+def _return_bounds(closes: Sequence[float], span: int) -> tuple[list[float], list[tuple[int, int]]]:
+    """Returns of the whole series plus, per window, the index range of its returns."""
+    positions: list[int] = []
+    rets: list[float] = []
+    for i in range(1, len(closes)):
+        if closes[i - 1] != 0:
+            positions.append(i)
+            rets.append((closes[i] - closes[i - 1]) / closes[i - 1])
+    bounds = [
+        (bisect_left(positions, end - span + 1), bisect_left(positions, end)) for end in range(span, len(closes) + 1)
+    ]
+    return rets, bounds
+
+
+def rolling_volatility_series(closes: Sequence[float], span: int, window: int = 20) -> list[float]:
+    rets, bounds = _return_bounds(closes, span)
+    sums = _prefix(rets)
+    squares = _prefix(r * r for r in rets)
+    annualize = sqrt(252)
+    values: list[float] = []
+    for start, (lo, hi) in enumerate(bounds):
+        if hi - lo < 2:
+            values.append(0.0)
+            continue
+        lo = max(lo, hi - window)
+        count = hi - lo
+        total = sums[hi] - sums[lo]
+        window_squares = squares[hi] - squares[lo]
+        if squares[hi] > _CANCELLATION_RATIO * window_squares:
+            values.append(rolling_volatility(closes[start : start + span], window))
+            continue
+        variance = (window_squares - total * total / count) / count
+        values.append(sqrt(max(variance, 0.0)) * annualize)
+    return values
+
+
+def rsi_series(closes: Sequence[float], span: int, period: int = 14) -> list[float]:
+    count = len(closes) - span + 1
+    if count <= 0:
+        return []
+    if span <= period:
+        return [50.0] * count
+    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    gains = _prefix(max(delta, 0.0) for delta in deltas)
+    losses = _prefix(max(-delta, 0.0) for delta in deltas)
+    values: list[float] = []
+    # A window ending at bar ``end`` uses the deltas into its last ``period`` bars.
+    for end in range(span, len(closes) + 1):
+        avg_loss = (losses[end - 1] - losses[end - 1 - period]) / period
+        if avg_loss == 0:
+            values.append(100.0)
+            continue
+        avg_gain = (gains[end - 1] - gains[end - 1 - period]) / period
+        values.append(100.0 - (100.0 / (1.0 + avg_gain / avg_loss)))
+    return values
+
+
+def adx_series(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], span: int, period: int = 14
+) -> list[float]:
+    count = len(closes) - span + 1
+    if count <= 0:
+        return []
+    if span <= period + 1:
+        return [10.0] * count
+    trs: list[float] = []
+    plus_dm: list[float] = []
+    minus_dm: list[float] = []
+    for i in range(1, len(closes)):
+        prev_close = closes[i - 1]
+        trs.append(max(highs[i] - lows[i], abs(highs[i] - prev_close), abs(lows[i] - prev_close)))
+        up_move = highs[i] - highs[i - 1]
+        down_move = lows[i - 1] - lows[i]
+        plus_dm.append(up_move if up_move > down_move and up_move > 0 else 0.0)
+        minus_dm.append(down_move if down_move > up_move and down_move > 0 else 0.0)
+    tr_sums = _prefix(trs)
+    plus_sums = _prefix(plus_dm)
+    minus_sums = _prefix(minus_dm)
+    values: list[float] = []
+    for end in range(span, len(closes) + 1):
+        tr_n = tr_sums[end - 1] - tr_sums[end - 1 - period]
+        if tr_n == 0:
+            values.append(10.0)
+            continue
+        plus_di = 100.0 * (plus_sums[end - 1] - plus_sums[end - 1 - period]) / tr_n
+        minus_di = 100.0 * (minus_sums[end - 1] - minus_sums[end - 1 - period]) / tr_n
+        if plus_di + minus_di == 0:
+            values.append(10.0)
+            continue
+        values.append(100.0 * abs(plus_di - minus_di) / (plus_di + minus_di))
+    return values
+
+
+def volatility_clustering_series(closes: Sequence[float], span: int, window: int = 30) -> list[float]:
+    rets, bounds = _return_bounds(closes, span)
+    moves = [abs(r) for r in rets]
+    sums = _prefix(moves)
+    squares = _prefix(m * m for m in moves)
+    cross = _prefix(left * right for left, right in zip(moves, moves[1:]))
+    values: list[float] = []
+    for start, (lo, hi) in enumerate(bounds):
+        lo = max(lo, hi - window)
+        pairs = hi - lo - 1
+        if pairs < 2:
+            values.append(0.0)
+            continue
+        left_sum = sums[hi - 1] - sums[lo]
+        right_sum = sums[hi] - sums[lo + 1]
+        left_squares = squares[hi - 1] - squares[lo]
+        right_squares = squares[hi] - squares[lo + 1]
+        left_var = left_squares - left_sum * left_sum / pairs
+        right_var = right_squares - right_sum * right_sum / pairs
+        if (
+            left_var <= _DEGENERATE_VARIANCE * left_squares
+            or right_var <= _DEGENERATE_VARIANCE * right_squares
+            or squares[hi] > _CANCELLATION_RATIO * min(left_squares, right_squares)
+        ):
+            values.append(volatility_clustering(closes[start : start + span], window))
+            continue
+        numerator = cross[hi - 1] - cross[lo] - left_sum * right_sum / pairs
+        values.append(max(-1.0, min(1.0, numerator / sqrt(left_var * right_var))))
+    return values
+
+
+def hurst_exponent_series(closes: Sequence[float], span: int, max_lag: int = 20) -> list[float]:
+    count = len(closes) - span + 1
+    if count <= 0:
+        return []
+    if span < max_lag + 2:
+        return [0.5] * count
+    lags = range(2, max_lag)
+    log_lags = [log(float(lag)) for lag in lags]
+    x_mean = mean(log_lags)
+    x_var = sum((x - x_mean) ** 2 for x in log_lags)
+    # With every tau positive the slope is a fixed weighting of log(tau), and
+    # log(tau) = (log(size * variance) - log(size)) / 2. The per-lag passes run
+    # through map() so the window arithmetic stays in C.
+    slopes = [0.0] * count
+    offset = 0.0
+    degenerate: set[int] = set()
+    for lag, log_lag in zip(lags, log_lags):
+        weight = (log_lag - x_mean) / x_var / 2
+        size = span - lag
+        diffs = list(map(sub, closes[lag:], closes))
+        sums = _prefix(diffs)
+        squares = _prefix(map(mul, diffs, diffs))
+        totals = list(map(sub, sums[size:], sums))
+        square_totals = list(map(sub, squares[size:], squares))
+        # size * variance of each window's diffs
+        scaled = list(map(sub, square_totals, map(mul, totals, map(truediv, totals, repeat(size)))))
+        flags = map(le, scaled, map(mul, square_totals, repeat(_DEGENERATE_VARIANCE)))
+        degenerate.update(compress(range(count), flags))
+        logs = map(log, map(max, scaled, repeat(_TINY)))
+        slopes = list(map(add, slopes, map(mul, logs, repeat(weight))))
+        offset += weight * log(size)
+    values = [max(0.0, min(1.0, (slope - offset) * 2)) for slope in slopes]
+    for start in degenerate:
+        values[start] = hurst_exponent(closes[start : start + span], max_lag)
+    return values
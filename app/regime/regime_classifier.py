@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
 
+from app.data.frame import OHLCVFrame
 from app.regime.confidence_scoring import (
     score_breakout,
     score_mean_reversion,
@@ -11,7 +12,7 @@ from app.regime.confidence_scoring import (
     score_trending,
     score_volatility,
 )
-from app.regime.indicators import Candle, adx, hurst_exponent, rolling_volatility, rsi, volatility_clustering
+from app.regime.indicators import rolling_indicators
 
 
 @dataclass(frozen=True)
@@ -33,49 +34,41 @@ class RegimeClassifier:
         "mean_reversion",
     )
 
-    def classify(self, candles: list[dict[str, Any]]) -> RegimeSnapshot:
-        if len(candles) < 25:
+    def classify(self, candles: OHLCVFrame | Sequence[Mapping[str, object]]) -> RegimeSnapshot:
+        frame = OHLCVFrame.coerce(candles)
+        if len(frame) < 25:
             return RegimeSnapshot(
                 current_regime="ranging",
                 confidence_score=35.0,
                 historical_distribution={name: 0.0 for name in self._regimes},
             )
 
-        normalized = [
-            Candle(
-                open=float(point["open"]),
-                high=float(point["high"]),
-                low=float(point["low"]),
-                close=float(point["close"]),
-                volume=float(point.get("volume", 0.0)),
+        current_label, current_conf = self._classify_window(frame.high, frame.low, frame.close)
+
+        # Label every trailing window of the history from indicator series
+        # computed in one pass rather than rerunning them per window.
+        sample_window = min(80, len(frame))
+        rolling = rolling_indicators(frame.high, frame.low, frame.close, sample_window)
+        history_labels = [
+            self._label(vol, adx_value, rsi_value, clustering, hurst)[0]
+            for vol, adx_value, rsi_value, clustering, hurst in zip(
+                rolling.volatility, rolling.adx, rolling.rsi, rolling.clustering, rolling.hurst, strict=True
             )
-            for point in candles
         ]
 
-        current_label, current_conf = self._classify_window(normalized)
-
-        history_labels: list[str] = []
-        sample_window = min(80, len(normalized))
-        for idx in range(sample_window, len(normalized) + 1):
-            window = normalized[max(0, idx - sample_window):idx]
-            label, _ = self._classify_window(window)
-            history_labels.append(label)
-
-        distribution = self._distribution(history_labels)
+        distribution = self._distribution(Counter(history_labels))
         return RegimeSnapshot(
             current_regime=current_label,
             confidence_score=round(current_conf, 2),
             historical_distribution=distribution,
         )
 
-    def _classify_window(self, candles: list[Candle]) -> tuple[str, float]:
-        closes = [c.close for c in candles]
-        vol = rolling_volatility(closes)
-        adx_value = adx(candles)
-        rsi_value = rsi(closes)
-        clustering = volatility_clustering(closes)
-        hurst = hurst_exponent(closes)
+    def _classify_window(self, highs: Sequence[float], lows: Sequence[float], closes: Sequence[float]) -> tuple[str, float]:
+        # A single window spanning every bar.
+        window = rolling_indicators(highs, lows, closes, len(closes))
+        return self._label(window.volatility[0], window.adx[0], window.rsi[0], window.clustering[0], window.hurst[0])
 
+    def _label(self, vol: float, adx_value: float, rsi_value: float, clustering: float, hurst: float) -> tuple[str, float]:
         scores = {
             "trending": score_trending(adx_value, hurst, rsi_value),
             "ranging": score_ranging(adx_value, hurst, rsi_value),
@@ -88,9 +81,8 @@ class RegimeClassifier:
         label, score = max(scores.items(), key=lambda item: item[1])
         return label, score
 
-    def _distribution(self, labels: list[str]) -> dict[str, float]:
-        if not labels:
+    def _distribution(self, counts: Counter[str]) -> dict[str, float]:
+        total = sum(counts.values())
+        if not total:
             return {name: 0.0 for name in self._regimes}
-        counts = Counter(labels)
-        total = len(labels)
         return {name: round((counts.get(name, 0) / total) * 100.0, 2) for name in self._regimes}
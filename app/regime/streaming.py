@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Iterable, Mapping
+from math import log, sqrt
+from statistics import mean
+
+from app.regime.indicators import hurst_exponent, volatility_clustering
+from app.regime.regime_classifier import RegimeClassifier, RegimeSnapshot
+
+# Running sums are rebuilt from their windows this often (in bars) so float
+# drift from adding and removing values cannot accumulate.
+_RESYNC_BARS = 1000
+# Same guard as the rolling engine: near-zero variances are recomputed exactly.
+_DEGENERATE_VARIANCE = 1e-10
+_CLUSTERING_RETURNS = 30
+# Removing a value whose square outweighs what remains by this factor leaves
+# mostly rounding error in the sums (e.g. the return off a near-zero close),
+# so the window is summed again instead.
+_CANCELLATION_RATIO = 1e8
+
+
+class _RunningSums:
+    """Running sum and sum of squares of a multiset of floats.
+
+    Sums return to exactly zero once only zeros remain, so flat stretches
+    (no price change) score like the batch functions instead of on rounding
+    residue.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.squares = 0.0
+        self._nonzero = 0
+
+    def add(self, value: float) -> None:
+        if value:
+            self.total += value
+            self.squares += value * value
+            self._nonzero += 1
+
+    def remove(self, value: float) -> None:
+        if value:
+            self._nonzero -= 1
+            if self._nonzero:
+                self.total -= value
+                self.squares -= value * value
+            else:
+                self.total = self.squares = 0.0
+
+    def reset(self, values: Iterable[float]) -> None:
+        values = [value for value in values if value]
+        self.total = sum(values)
+        self.squares = sum(value * value for value in values)
+        self._nonzero = len(values)
+
+
+class _RunningWindow(_RunningSums):
+    """Newest ``size`` values with their running sums."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__()
+        self.size = size
+        self.values: deque[float] = deque()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, value: float) -> None:
+        self.values.append(value)
+        self.add(value)
+        if len(self.values) > self.size:
+            self.popleft()
+
+    def popleft(self) -> float:
+        value = self.values.popleft()
+        self.remove(value)
+        if _dominates(value, self.squares):
+            self.resync()
+        return value
+
+    def resync(self) -> None:
+        self.reset(self.values)
+
+
+def _dominates(value: float, squares: float) -> bool:
+    return value * value > _CANCELLATION_RATIO * abs(squares)
+
+
+class StreamingRegimeClassifier(RegimeClassifier):
+    """Classify one series incrementally, one closed candle per ``update``.
+
+    Every indicator is kept as running sums over the same trailing windows
+    ``classify`` uses (20 returns for volatility, 14 bars for RSI and ADX, 30
+    absolute returns for clustering, and lags 2..19 of the last ``window``
+    closes for Hurst), so each update costs a fixed amount of work however
+    long the series runs. The snapshot matches ``classify`` on the last
+    ``window`` candles, and the distribution counts the label of every
+    ``window``-bar window seen so far, as ``classify`` does over a history.
+    """
+
+    def __init__(self, window: int = 80, max_lag: int = 20) -> None:
+        if window < max(25, max_lag + 2):
+            raise ValueError(f"Streaming window must cover at least {max(25, max_lag + 2)} bars")
+        self.window = window
+        self.max_lag = max_lag
+        self.bars = 0
+        self._closes: deque[float] = deque(maxlen=window)
+        self._high = 0.0
+        self._low = 0.0
+        # Returns carry the index of the bar they end on: bars after a zero
+        # close have none, so the newest N returns may reach outside the window.
+        self._returns = _RunningWindow(20)
+        self._return_bars: deque[int] = deque()
+        # Capped at _CLUSTERING_RETURNS by _advance_bar, which also keeps the
+        # sum of products of neighbouring moves.
+        self._moves = _RunningWindow(window)
+        self._move_bars: deque[int] = deque()
+        self._move_cross = 0.0
+        self._gains = _RunningWindow(14)
+        self._losses = _RunningWindow(14)
+        self._true_ranges = _RunningWindow(14)
+        self._plus_dm = _RunningWindow(14)
+        self._minus_dm = _RunningWindow(14)
+        self._lags = range(2, max_lag)
+        self._lag_diffs = [_RunningSums() for _ in self._lags]
+        log_lags = [log(float(lag)) for lag in self._lags]
+        x_mean = mean(log_lags)
+        x_var = sum((x - x_mean) ** 2 for x in log_lags)
+        self._hurst_weights = [(x - x_mean) / x_var / 2 for x in log_lags]
+        self._counts: Counter[str] = Counter()
+
+    def update(self, candle: Mapping[str, object]) -> RegimeSnapshot:
+        """Apply the next closed candle and return the regime of the trailing window."""
+        high, low, close = float(candle["high"]), float(candle["low"]), float(candle["close"])
+        index = self.bars
+        if self._closes:
+            self._advance_bar(index, high, low, close)
+        self._push_close(close)
+        self._high, self._low = high, low
+        self.bars += 1
+        if self.bars % _RESYNC_BARS == 0:
+            self._resync()
+
+        if len(self._closes) < 25:
+            return RegimeSnapshot(
+                current_regime="ranging",
+                confidence_score=35.0,
+                historical_distribution={name: 0.0 for name in self._regimes},
+            )
+        label, confidence = self._label(
+            self._volatility(), self._adx(), self._rsi(), self._clustering(), self._hurst()
+        )
+        if len(self._closes) == self.window:
+            self._counts[label] += 1
+        return RegimeSnapshot(
+            current_regime=label,
+            confidence_score=round(confidence, 2),
+            historical_distribution=self._distribution(self._counts or Counter({label: 1})),
+        )
+
+    def _advance_bar(self, index: int, high: float, low: float, close: float) -> None:
+        prev_close = self._closes[-1]
+        delta = close - prev_close
+        self._gains.push(max(delta, 0.0))
+        self._losses.push(max(-delta, 0.0))
+        self._true_ranges.push(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        up_move = high - self._high
+        down_move = self._low - low
+        self._plus_dm.push(up_move if up_move > down_move and up_move > 0 else 0.0)
+        self._minus_dm.push(down_move if down_move > up_move and down_move > 0 else 0.0)
+
+        if prev_close != 0:
+            ret = delta / prev_close
+            self._returns.push(ret)
+            self._return_bars.append(index)
+            if len(self._return_bars) > len(self._returns):
+                self._return_bars.popleft()
+            if self._moves.values:
+                self._move_cross += self._moves.values[-1] * abs(ret)
+            self._moves.push(abs(ret))
+            self._move_bars.append(index)
+            if len(self._moves) > _CLUSTERING_RETURNS:
+                self._pop_move()
+
+        # Returns ending on the bar that just left the window no longer count.
+        first_bar = max(0, index + 1 - self.window)
+        while self._return_bars and self._return_bars[0] <= first_bar:
+            self._return_bars.popleft()
+            self._returns.popleft()
+        while self._move_bars and self._move_bars[0] <= first_bar:
+            self._pop_move()
+
+    def _pop_move(self) -> None:
+        self._move_bars.popleft()
+        evicted = self._moves.popleft()
+        moves = self._moves.values
+        if _dominates(evicted, self._moves.squares):
+            self._move_cross = sum(left * right for left, right in zip(moves, list(moves)[1:]))
+        elif moves:
+            self._move_cross -= evicted * moves[0]
+
+    def _push_close(self, close: float) -> None:
+        closes = self._closes
+        if len(closes) == self.window:
+            oldest = closes[0]
+            for lag, diffs in zip(self._lags, self._lag_diffs):
+                diffs.remove(closes[lag] - oldest)
+        for lag, diffs in zip(self._lags, self._lag_diffs):
+            if len(closes) >= lag:
+                diffs.add(close - closes[-lag])
+        closes.append(close)
+
+    def _resync(self) -> None:
+        for running in (
+            self._returns,
+            self._moves,
+            self._gains,
+            self._losses,
+            self._true_ranges,
+            self._plus_dm,
+            self._minus_dm,
+        ):
+            running.resync()
+        moves = self._moves.values
+        self._move_cross = sum(left * right for left, right in zip(moves, list(moves)[1:]))
+        closes = list(self._closes)
+        for lag, diffs in zip(self._lags, self._lag_diffs):
+            diffs.reset(closes[i + lag] - closes[i] for i in range(len(closes) - lag))
+
+    def _volatility(self) -> float:
+        count = len(self._returns)
+        if count < 2:
+            return 0.0
+        total = self._returns.total
+        variance = (self._returns.squares - total * total / count) / count
+        return sqrt(max(variance, 0.0)) * sqrt(252)
+
+    # update() only scores windows of 25+ bars, so the 14-bar RSI and ADX
+    # windows are always full here.
+    def _rsi(self) -> float:
+        if self._losses.total <= 0:
+            return 100.0
+        return 100.0 - (100.0 / (1.0 + self._gains.total / self._losses.total))
+
+    def _adx(self) -> float:
+        tr_n = self._true_ranges.total
+        if tr_n <= 0:
+            return 10.0
+        plus_di = 100.0 * self._plus_dm.total / tr_n
+        minus_di = 100.0 * self._minus_dm.total / tr_n
+        if plus_di + minus_di == 0:
+            return 10.0
+        return 100.0 * abs(plus_di - minus_di) / (plus_di + minus_di)
+
+    def _clustering(self) -> float:
+        moves = self._moves.values
+        pairs = len(moves) - 1
+        if pairs < 2:
+            return 0.0
+        first, last = moves[0], moves[-1]
+        left_sum = self._moves.total - last
+        right_sum = self._moves.total - first
+        left_squares = self._moves.squares - last * last
+        right_squares = self._moves.squares - first * first
+        left_var = left_squares - left_sum * left_sum / pairs
+        right_var = right_squares - right_sum * right_sum / pairs
+        if left_var <= _DEGENERATE_VARIANCE * left_squares or right_var <= _DEGENERATE_VARIANCE * right_squares:
+            return volatility_clustering(list(self._closes), _CLUSTERING_RETURNS)
+        numerator = self._move_cross - left_sum * right_sum / pairs
+        return max(-1.0, min(1.0, numerator / sqrt(left_var * right_var)))
+
+    def _hurst(self) -> float:
+        size = len(self._closes)
+        if size < self.max_lag + 2:
+            return 0.5
+        slope = 0.0
+        for lag, diffs, weight in zip(self._lags, self._lag_diffs, self._hurst_weights):
+            count = size - lag
+            scaled = diffs.squares - diffs.total * diffs.total / count
+            if scaled <= _DEGENERATE_VARIANCE * diffs.squares:
+                return hurst_exponent(list(self._closes), self.max_lag)
+            slope += weight * log(scaled / count)
+        return max(0.0, min(1.0, slope * 2))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from app.backtesting.backtester import Backtester
-from app.data.data_manager import DataManager
+from app.data.data_manager import data_manager
 from app.regime.regime_classifier import RegimeClassifier
 from app.scoring.confidence import confidence_score
 
@@ -12,7 +12,7 @@ class SignalRanker:
     """Institutional ranking for signal alternatives on one asset."""
 
     def __init__(self) -> None:
-        self.data_manager = DataManager()
+        self.data_manager = data_manager
         self.backtester = Backtester()
         self.regime_classifier = RegimeClassifier()
         self.signal_ids = ["trend_v1", "mean_reversion_v1", "breakout_v1"]
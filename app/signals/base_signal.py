@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+from app.data.frame import OHLCVFrame
+
 
 @dataclass(frozen=True)
 class SignalCandidate:
@@ -34,7 +36,7 @@ class BaseSignal(ABC):
         self,
         asset: str,
         timeframe: str,
-        ohlcv: list[dict[str, Any]],
+        ohlcv: OHLCVFrame,
         regime: str,
     ) -> SignalCandidate | None:
         """Generate a signal candidate if strategy conditions are met."""
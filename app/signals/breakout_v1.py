@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
-
+from app.data.frame import OHLCVFrame
 from app.signals.base_signal import BaseSignal, SignalCandidate
 
 
@@ -16,19 +15,18 @@ class BreakoutV1(BaseSignal):
         self.volume_multiplier = volume_multiplier
         self.stop_loss_pct = stop_loss_pct
 
-    def generate(self, asset: str, timeframe: str, ohlcv: list[dict[str, Any]], regime: str) -> SignalCandidate | None:
+    def generate(self, asset: str, timeframe: str, ohlcv: OHLCVFrame, regime: str) -> SignalCandidate | None:
         if timeframe not in self.compatible_timeframes or regime not in self.compatible_regimes:
             return None
         if len(ohlcv) < self.breakout_window + 1:
             return None
 
-        recent = ohlcv[-(self.breakout_window + 1):-1]
-        last = ohlcv[-1]
-        prior_high = max(float(row["high"]) for row in recent)
-        prior_low = min(float(row["low"]) for row in recent)
-        avg_volume = sum(float(row.get("volume", 0.0)) for row in recent) / len(recent)
-        last_close = float(last["close"])
-        last_volume = float(last.get("volume", 0.0))
+        recent = slice(-(self.breakout_window + 1), -1)
+        prior_high = max(ohlcv.high[recent])
+        prior_low = min(ohlcv.low[recent])
+        avg_volume = sum(ohlcv.volume[recent]) / self.breakout_window
+        last_close = ohlcv.close[-1]
+        last_volume = ohlcv.volume[-1]
 
         direction: str | None = None
         if last_close > prior_high and last_volume >= avg_volume * self.volume_multiplier:
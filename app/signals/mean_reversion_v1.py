@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from statistics import mean, pstdev
-from typing import Any
 
+from app.data.frame import OHLCVFrame
 from app.signals.base_signal import BaseSignal, SignalCandidate
 
 
@@ -17,10 +17,10 @@ class MeanReversionV1(BaseSignal):
         self.z_threshold = z_threshold
         self.stop_loss_pct = stop_loss_pct
 
-    def generate(self, asset: str, timeframe: str, ohlcv: list[dict[str, Any]], regime: str) -> SignalCandidate | None:
+    def generate(self, asset: str, timeframe: str, ohlcv: OHLCVFrame, regime: str) -> SignalCandidate | None:
         if timeframe not in self.compatible_timeframes or regime not in self.compatible_regimes:
             return None
-        closes = [float(row["close"]) for row in ohlcv]
+        closes = ohlcv.close
         if len(closes) < self.lookback + 2:
             return None
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import Any
 
-from app.data.data_manager import DataManager
+from app.data.data_manager import data_manager
 from app.regime.regime_classifier import RegimeClassifier
 from app.signals.base_signal import SignalCandidate
 from app.signals.breakout_v1 import BreakoutV1
@@ -15,7 +15,7 @@ class SignalManager:
     """Generate and rank candidate strategy signals."""
 
     def __init__(self) -> None:
-        self.data_manager = DataManager()
+        self.data_manager = data_manager
         self.regime_classifier = RegimeClassifier()
         self.strategies = [
             TrendSignalV1(),
@@ -13,7 +13,38 @@ class Settings:
     app_host: str = os.getenv("APP_HOST", "127.0.0.1")
     app_port: int = int(os.getenv("APP_PORT", "8000"))
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    gzip_minimum_bytes: int = int(os.getenv("GZIP_MINIMUM_BYTES", "1024"))
     db_path: Path = Path(os.getenv("DB_PATH", "app/data/assemblief.db"))
+    cache_backend: str = os.getenv("CACHE_BACKEND", "sqlite").lower()
+    columnar_cache_dir: Path = Path(os.getenv("COLUMNAR_CACHE_DIR", "app/data/columns"))
+    db_threads: int = int(os.getenv("DB_THREADS", "4"))
+    sqlite_cache_mb: int = int(os.getenv("SQLITE_CACHE_MB", "64"))
+    sqlite_mmap_mb: int = int(os.getenv("SQLITE_MMAP_MB", "256"))
+    retention_days: str = os.getenv("RETENTION_DAYS", "1m=90,5m=365")
+    maintenance_interval_seconds: float = float(os.getenv("MAINTENANCE_INTERVAL_SECONDS", "3600"))
+    backfill_concurrency: int = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+    batch_provider_concurrency: int = int(os.getenv("BATCH_PROVIDER_CONCURRENCY", "8"))
+    memory_cache_max_rows: int = int(os.getenv("MEMORY_CACHE_MAX_ROWS", "250000"))
+    cache_max_ttl_seconds: int = int(os.getenv("CACHE_MAX_TTL_SECONDS", "3600"))
+    http_timeout_seconds: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "15"))
+    http_connect_timeout_seconds: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    http_max_keepalive_connections: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    http_keepalive_expiry_seconds: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    upstream_max_retries: int = int(os.getenv("UPSTREAM_MAX_RETRIES", "4"))
+    circuit_failure_threshold: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    circuit_slow_call_seconds: float = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "5"))
+    circuit_reset_seconds: float = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))
+    watchlist_assets: str = os.getenv("WATCHLIST", "")
+    watchlist_timeframes: str = os.getenv("WATCHLIST_TIMEFRAMES", "1h")
+    prewarm_delay_seconds: float = float(os.getenv("PREWARM_DELAY_SECONDS", "2"))
+    prewarm_stagger_seconds: float = float(os.getenv("PREWARM_STAGGER_SECONDS", "0.25"))
+    binance_stream_url: str = os.getenv("BINANCE_STREAM_URL", "wss://stream.binance.com:9443/ws")
+    live_streams: str = os.getenv("LIVE_STREAMS", "")
+    live_buffer_bars: int = int(os.getenv("LIVE_BUFFER_BARS", "1000"))
+    live_flush_seconds: float = float(os.getenv("LIVE_FLUSH_SECONDS", "5"))
+    write_behind_max_pending: int = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "10000"))
+    http2_enabled: bool = os.getenv("HTTP2_ENABLED", "true").lower() in {"1", "true", "yes"}
 
     @property
     def database_url(self) -> str:
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+import os
+import tempfile
+
+import pytest
+
+# Settings are read at import time, so point storage at a scratch directory
+# before any app module is imported.
+_SCRATCH = tempfile.mkdtemp(prefix="market-data-tests-")
+os.environ.setdefault("DB_PATH", os.path.join(_SCRATCH, "cache.db"))
+os.environ.setdefault("COLUMNAR_CACHE_DIR", os.path.join(_SCRATCH, "columns"))
+
+def _candle(timestamp: datetime | float, close: float = 1.5, **fields: float) -> dict:
+    """One OHLCV point opening at ``timestamp`` (a datetime or epoch seconds)."""
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.fromtimestamp(timestamp, tz=UTC)
+    return {"timestamp": timestamp, "open": 1.0, "high": 2.0, "low": 0.5, "close": close, "volume": 10.0, **fields}
+
+
+@pytest.fixture
+def candle() -> Callable[..., dict]:
+    """Build candle points; override any OHLCV field by keyword."""
+    return _candle
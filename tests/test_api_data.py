@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.app_factory import create_app
+
+
+def test_batch_stream_is_not_gzip_buffered():
+    client = TestClient(create_app())
+    response = client.post(
+        "/api/data/batch",
+        json={"series": [{"asset": "nomarket"}, {"asset": "alsonone"}]},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "identity"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["status"] for line in lines] == [400, 400]
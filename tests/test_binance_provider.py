@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from app.data.binance_provider import BinanceProvider
+
+
+def test_abandoned_backfill_waits_for_its_page_tasks():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["startTime"])
+        if start != first_page:
+            await asyncio.sleep(60)
+        return httpx.Response(200, json=[[start, "1", "2", "0.5", "1.5", "10"]])
+
+    end = datetime(2024, 1, 1, tzinfo=UTC)
+    start = end - timedelta(minutes=3000)
+    first_page = int(start.timestamp() * 1000)
+    provider = BinanceProvider()
+    provider.attach_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def main() -> None:
+        pages = provider.iter_range("BTCUSDT", "1m", start, end)
+        assert len(await anext(pages)) == 1
+        await pages.aclose()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.data.base_provider import BaseDataProvider
+from app.data.circuit_breaker import CLOSED, HALF_OPEN, CircuitOpenError
+
+
+class _Provider(BaseDataProvider):
+    name = "fake"
+
+    async def fetch_ohlcv(self, asset, timeframe, limit=300, since=None):
+        return []
+
+
+def _half_open_provider(handler) -> BaseDataProvider:
+    provider = _Provider()
+    provider.attach_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    breaker = provider.circuit_breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    # Pretend the reset period has elapsed so the next request is the probe.
+    breaker._opened_at -= breaker.reset_seconds
+    assert breaker.allows_requests
+    return provider
+
+
+def test_open_circuit_fails_fast():
+    provider = _Provider()
+    for _ in range(provider.circuit_breaker.failure_threshold):
+        provider.circuit_breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(provider._get_json("https://upstream.test/klines", {}))
+    assert provider.circuit_breaker.rejected_count == 1
+
+
+def test_probe_cancelled_while_rate_limited_frees_the_slot():
+    provider = _half_open_provider(lambda request: httpx.Response(200, json=[1]))
+    breaker = provider.circuit_breaker
+
+    async def main() -> None:
+        provider.rate_limiter._paused_until = time.monotonic() + 60
+        task = asyncio.create_task(provider._get_json("https://upstream.test/klines", {}))
+        await asyncio.sleep(0)
+        assert breaker.state == HALF_OPEN and not breaker.allows_requests
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert breaker.allows_requests
+
+        provider.rate_limiter._paused_until = 0.0
+        assert await provider._get_json("https://upstream.test/klines", {}) == [1]
+        assert breaker.state == CLOSED
+
+    asyncio.run(main())
+
+
+def test_probe_cancelled_in_flight_frees_the_slot():
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(60)
+        return httpx.Response(200, json=[])
+
+    provider = _half_open_provider(slow)
+    breaker = provider.circuit_breaker
+
+    async def main() -> None:
+        task = asyncio.create_task(provider._get_json("https://upstream.test/klines", {}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert breaker.allows_requests
+
+    asyncio.run(main())
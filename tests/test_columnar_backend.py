@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from app.data.columnar_backend import ColumnarCacheBackend
+from app.data.frame import OHLCVFrame
+
+SERIES = ("binance", "BTCUSDT", "1m")
+MINUTE_MS = 60_000
+
+
+@pytest.fixture
+def frame(candle: Callable[..., dict]) -> Callable[..., OHLCVFrame]:
+    def build(opens_ms: list[int], close: float) -> OHLCVFrame:
+        return OHLCVFrame.from_points([candle(ms / 1000, close=close) for ms in opens_ms])
+
+    return build
+
+
+def _minutes(first: int, last: int) -> list[int]:
+    return [minute * MINUTE_MS for minute in range(first, last + 1)]
+
+
+def _generation(backend: ColumnarCacheBackend) -> int:
+    return backend._read_manifest(backend._series_dir(*SERIES)).generation
+
+
+def test_tail_refresh_rewrites_in_place_without_touching_loaded_frames(tmp_path, frame):
+    backend = ColumnarCacheBackend(tmp_path)
+    backend.upsert(*SERIES, frame(_minutes(0, 4), close=1.0))
+    before = backend.load(*SERIES, 10)
+
+    # The forming bar again plus one new bar: the in-place tail path.
+    backend.upsert(*SERIES, frame(_minutes(4, 5), close=2.0))
+
+    assert _generation(backend) == 0
+    assert list(before.close) == [1.0] * 5
+    after = backend.load(*SERIES, 10)
+    assert list(after.timestamp) == _minutes(0, 5)
+    assert list(after.close) == [1.0] * 4 + [2.0, 2.0]
+
+
+def test_out_of_order_merge_writes_a_new_generation(tmp_path, frame):
+    backend = ColumnarCacheBackend(tmp_path)
+    backend.upsert(*SERIES, frame(_minutes(2, 4), close=1.0))
+    before = backend.load(*SERIES, 10)
+
+    backend.upsert(*SERIES, frame(_minutes(0, 2), close=3.0))
+
+    assert _generation(backend) == 1
+    assert not list(backend._series_dir(*SERIES).glob("*.0.bin"))
+    assert list(before.close) == [1.0] * 3
+    after = backend.load(*SERIES, 10)
+    assert list(after.timestamp) == _minutes(0, 4)
+    assert list(after.close) == [3.0, 3.0, 3.0, 1.0, 1.0]
+
+
+def test_delete_before_keeps_newer_rows(tmp_path, frame):
+    backend = ColumnarCacheBackend(tmp_path)
+    backend.upsert(*SERIES, frame(_minutes(0, 9), close=1.0))
+
+    assert backend.delete_before(*SERIES, 6 * MINUTE_MS) == 6
+    assert backend.delete_before(*SERIES, 6 * MINUTE_MS) == 0
+    assert list(backend.load(*SERIES, 100).timestamp) == _minutes(6, 9)
+    [stats] = backend.series_stats()
+    assert (stats["rows"], stats["first"], stats["last"]) == (4, 6 * MINUTE_MS, 9 * MINUTE_MS)
+
+
+def test_record_empty_ranges_merges_repeated_fills(tmp_path):
+    backend = ColumnarCacheBackend(tmp_path)
+    backend.record_empty_ranges(*SERIES, [(0, MINUTE_MS), (5 * MINUTE_MS, 6 * MINUTE_MS)])
+    backend.record_empty_ranges(*SERIES, [(0, MINUTE_MS)])
+
+    assert backend.empty_ranges(*SERIES) == [(0, MINUTE_MS), (5 * MINUTE_MS, 6 * MINUTE_MS)]
+
+
+def test_reopened_backend_reads_the_committed_manifest(tmp_path, frame):
+    backend = ColumnarCacheBackend(tmp_path)
+    backend.upsert(*SERIES, frame(_minutes(0, 4), close=1.0))
+    backend.upsert(*SERIES, frame(_minutes(4, 6), close=2.0))
+    refreshed_at = backend.last_refreshed_at(*SERIES)
+
+    reopened = ColumnarCacheBackend(tmp_path)
+    loaded = reopened.load(*SERIES, 3)
+    assert list(loaded.timestamp) == _minutes(4, 6)
+    assert list(loaded.close) == [2.0] * 3
+    assert reopened.last_refreshed_at(*SERIES) == refreshed_at
+    assert reopened.load("binance", "ETHUSDT", "1m", 3) == OHLCVFrame()
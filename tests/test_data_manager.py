@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import time
+
+from app.data.base_provider import TIMEFRAME_SECONDS, BaseDataProvider
+from app.data.data_manager import DataManager
+from app.data.database import initialize_database
+from app.data.frame import OHLCVFrame
+
+
+class _Provider(BaseDataProvider):
+    name = "binance"
+
+    def __init__(self, candle: Callable[..., dict], delay: float = 0.0) -> None:
+        super().__init__()
+        self.candle = candle
+        self.delay = delay
+        self.calls: list[tuple[str, int, datetime | None]] = []
+
+    async def fetch_ohlcv(self, asset, timeframe, limit=300, since=None):
+        self.calls.append((asset, limit, since))
+        await asyncio.sleep(self.delay)
+        step = TIMEFRAME_SECONDS[timeframe]
+        newest = int(time.time()) // step * step
+        points = [self.candle(newest - (limit - 1 - i) * step) for i in range(limit)]
+        return [point for point in points if since is None or point["timestamp"] >= since]
+
+
+def _manager(provider: BaseDataProvider) -> DataManager:
+    initialize_database()
+    manager = DataManager()
+    manager.providers["crypto"] = provider
+    return manager
+
+
+def test_larger_concurrent_request_is_not_cut_to_the_running_fetch(candle):
+    provider = _Provider(candle, delay=0.05)
+    manager = _manager(provider)
+
+    async def main() -> None:
+        small = asyncio.create_task(manager.get_ohlcv("crypto:SIZEUSDT", "1h", limit=50))
+        while not provider.calls:
+            await asyncio.sleep(0.001)
+        large = asyncio.create_task(manager.get_ohlcv("crypto:SIZEUSDT", "1h", limit=200))
+        assert (await small)["rows"] == 50
+        assert (await large)["rows"] == 200
+        await manager.aclose()
+
+    asyncio.run(main())
+    assert [limit for _, limit, _ in provider.calls] == [50, 200]
+
+
+def test_concurrent_cold_reads_share_one_fetch(candle):
+    provider = _Provider(candle, delay=0.05)
+    manager = _manager(provider)
+
+    async def main() -> None:
+        results = await asyncio.gather(*(manager.get_ohlcv("crypto:SHAREUSDT", "1h", limit=100) for _ in range(5)))
+        assert [result["rows"] for result in results] == [100] * 5
+        await manager.aclose()
+
+    asyncio.run(main())
+    assert len(provider.calls) == 1
+
+
+class _ShortHistoryProvider(_Provider):
+    """Serves only the last ten bars and has nothing inside the cached hole."""
+
+    def history_start(self, timeframe):
+        step = TIMEFRAME_SECONDS[timeframe]
+        return datetime.fromtimestamp((int(time.time()) // step - 10) * step, tz=UTC)
+
+    async def fetch_ohlcv(self, asset, timeframe, limit=300, since=None):
+        self.calls.append((asset, limit, since))
+        return []
+
+
+def test_gap_fill_leaves_history_beyond_the_provider_open(candle):
+    provider = _ShortHistoryProvider(candle)
+    manager = _manager(provider)
+    step = TIMEFRAME_SECONDS["1h"]
+    newest = int(time.time()) // step * step
+    cached = [candle(newest - back * step) for back in (30, 29, 2, 1, 0)]
+    manager.backend.upsert(provider.name, "HORIZONUSDT", "1h", OHLCVFrame.from_points(cached))
+
+    async def main() -> None:
+        result = await manager.fill_gaps("crypto:HORIZONUSDT", "1h")
+        assert result["unavailable_bars"] == 18
+        assert result["confirmed_empty_bars"] == 8
+        remaining = await manager.scan_gaps("crypto:HORIZONUSDT", "1h")
+        assert remaining["missing_bars"] == 18
+        await manager.aclose()
+
+    asyncio.run(main())
+    assert len(provider.calls) == 1
+
+
+def _bars(candle: Callable[..., dict], timeframe: str, count: int) -> list[dict]:
+    step = TIMEFRAME_SECONDS[timeframe]
+    newest = int(time.time()) // step * step
+    return [candle(newest - back * step) for back in range(count - 1, -1, -1)]
+
+
+def test_resampling_falls_back_to_the_provider_when_the_finer_series_has_holes(candle):
+    provider = _Provider(candle)
+    manager = _manager(provider)
+    finer = _bars(candle, "5m", 13 * 12)
+    manager.backend.upsert(provider.name, "WHOLEUSDT", "5m", OHLCVFrame.from_points(finer))
+    manager.backend.upsert(provider.name, "HOLEUSDT", "5m", OHLCVFrame.from_points(finer[:60] + finer[61:]))
+
+    async def main() -> None:
+        whole = await manager.get_ohlcv("crypto:WHOLEUSDT", "1h", limit=10)
+        assert whole["source"] == "resampled"
+        holed = await manager.get_ohlcv("crypto:HOLEUSDT", "1h", limit=10)
+        assert holed["source"] == "provider"
+        # The 5m source rows were read past the memory tier.
+        assert manager._memory.get(("binance", "WHOLEUSDT", "5m"), 1) is None
+        await manager.aclose()
+
+    asyncio.run(main())
+    assert [asset for asset, _, _ in provider.calls] == ["HOLEUSDT"]
+
+
+def test_slow_cache_load_does_not_overwrite_a_concurrent_ingest(candle):
+    manager = _manager(_Provider(candle))
+    key = ("binance", "RACEUSDT", "1h")
+    load_window = manager._load_window
+
+    def slow_load(*args):
+        time.sleep(0.1)
+        return load_window(*args)
+
+    manager._load_window = slow_load
+
+    async def main() -> None:
+        read = asyncio.create_task(manager._read_window(*key, 50))
+        await asyncio.sleep(0.02)
+        # An ingest writes its window through while the load is still reading the empty table.
+        fresh = OHLCVFrame.from_points(await _Provider(candle).fetch_ohlcv("RACEUSDT", "1h", limit=50))
+        manager._memory.put(key, fresh, refreshed_at=datetime.now(UTC), complete=True)
+        stale, _ = await read
+        assert len(stale) == 0
+        cached, refreshed_at = await manager._read_window(*key, 50)
+        assert len(cached) == 50 and refreshed_at is not None
+        await manager.aclose()
+
+    asyncio.run(main())
+
+
+def test_backfill_pages_go_through_the_write_behind_writer(candle):
+    manager = _manager(_Provider(candle))
+    step = TIMEFRAME_SECONDS["1h"]
+    end = datetime.fromtimestamp(int(time.time()) // step * step, tz=UTC)
+
+    async def main() -> None:
+        result = await manager.backfill("crypto:FILLUSDT", "1h", end - timedelta(hours=10), end)
+        assert result["rows"] == 11
+        assert manager._writer.stats()["rows"] == 11 and manager._writer.pending == 0
+        await manager.aclose()
+
+    asyncio.run(main())
+    assert len(manager.backend.load("binance", "FILLUSDT", "1h", 100)) == 11
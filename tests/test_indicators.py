@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.regime import indicators
+
+
+def _series(
+    count: int, seed: int, flat: range = range(0), zeros: tuple[int, ...] = (), tiny: tuple[int, ...] = ()
+) -> tuple[list[float], ...]:
+    rng = random.Random(seed)
+    price = 100.0
+    highs: list[float] = []
+    lows: list[float] = []
+    closes: list[float] = []
+    for i in range(count):
+        if i not in flat:
+            price *= 1 + rng.gauss(0.0003, 0.01)
+        close = 0.0 if i in zeros else 1e-12 if i in tiny else price
+        closes.append(close)
+        highs.append(close * (1 + abs(rng.gauss(0, 0.003))))
+        lows.append(close * (1 - abs(rng.gauss(0, 0.003))))
+    return highs, lows, closes
+
+
+def _constant(count: int) -> tuple[list[float], ...]:
+    return [101.0] * count, [99.0] * count, [100.0] * count
+
+
+@pytest.mark.parametrize(
+    ("highs", "lows", "closes"),
+    [
+        _series(200, 1),
+        _series(200, 2, flat=range(60, 150)),
+        _series(160, 3, zeros=(40, 41, 120)),
+        _series(200, 4, tiny=(50, 51)),
+        _constant(100),
+    ],
+    ids=["random-walk", "flat-stretch", "zero-closes", "near-zero-closes", "constant"],
+)
+@pytest.mark.parametrize("span", [10, 15, 16, 21, 30, 80])
+def test_rolling_series_match_the_single_window_functions(highs, lows, closes, span):
+    rolling = indicators.rolling_indicators(highs, lows, closes, span)
+    expected = {
+        "volatility": lambda s: indicators.rolling_volatility(closes[s : s + span]),
+        "adx": lambda s: indicators.adx(highs[s : s + span], lows[s : s + span], closes[s : s + span]),
+        "rsi": lambda s: indicators.rsi(closes[s : s + span]),
+        "clustering": lambda s: indicators.volatility_clustering(closes[s : s + span]),
+        "hurst": lambda s: indicators.hurst_exponent(closes[s : s + span]),
+    }
+    for name, single in expected.items():
+        series = getattr(rolling, name)
+        assert len(series) == len(closes) - span + 1, name
+        for start, value in enumerate(series):
+            assert value == pytest.approx(single(start), rel=1e-6, abs=1e-6), (name, start)
+
+
+def test_rolling_series_are_empty_when_the_history_is_shorter_than_the_span():
+    highs, lows, closes = _series(20, 5)
+    rolling = indicators.rolling_indicators(highs, lows, closes, 30)
+    assert rolling == indicators.RollingIndicators([], [], [], [], [])
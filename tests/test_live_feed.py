@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import replace
+import json
+import time
+
+import pytest
+import websockets
+
+from app.data import binance_provider
+from app.data.binance_provider import BinanceProvider
+from app.data.data_manager import DataManager
+from app.data.database import initialize_database
+from app.data.frame import OHLCVFrame
+from app.data.live_feed import LiveFeed
+from app.data.ring_buffer import CandleRingBuffer
+
+MINUTE_MS = 60_000
+
+
+def _kline(open_ms: int, close: float, closed: bool) -> str:
+    return json.dumps(
+        {"e": "kline", "k": {"t": open_ms, "o": "1", "h": "9", "l": "0.5", "c": str(close), "v": "5", "x": closed}}
+    )
+
+
+@asynccontextmanager
+async def _kline_server(monkeypatch: pytest.MonkeyPatch, messages: list[str]):
+    """Serve ``messages`` on every connection and point the Binance provider at it."""
+    paths: list[str] = []
+
+    async def handler(socket) -> None:
+        paths.append(socket.request.path)
+        for message in messages:
+            await socket.send(message)
+        await socket.wait_closed()
+
+    async with websockets.serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        stream_settings = replace(binance_provider.settings, binance_stream_url=f"ws://127.0.0.1:{port}/ws")
+        monkeypatch.setattr(binance_provider, "settings", stream_settings)
+        yield paths
+
+
+async def _until(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
+
+
+def _seed_points(candle: Callable[..., dict], newest_ms: int, count: int) -> list[dict]:
+    return [candle((newest_ms - back * MINUTE_MS) / 1000, close=1.0) for back in range(count - 1, -1, -1)]
+
+
+def test_ring_buffer_updates_the_forming_bar_and_wraps():
+    buffer = CandleRingBuffer(3)
+    for open_ms, close in [(1, 1.0), (2, 2.0), (2, 2.5), (3, 3.0), (4, 4.0)]:
+        assert buffer.update(open_ms, 1.0, 5.0, 0.5, close, 1.0)
+    assert not buffer.update(1, 1.0, 5.0, 0.5, 9.0, 1.0)
+    frame = buffer.frame(10)
+    assert list(frame.timestamp) == [2, 3, 4]
+    assert list(frame.close) == [2.5, 3.0, 4.0]
+
+
+def test_live_feed_buffers_forming_bars_and_flushes_closed_ones(monkeypatch, candle):
+    bar = int(time.time()) * 1000 // MINUTE_MS * MINUTE_MS
+    persisted: list[tuple[tuple[str, str, str], list[dict]]] = []
+
+    async def persist(key, points) -> None:
+        persisted.append((key, points))
+
+    async def seed() -> OHLCVFrame:
+        return OHLCVFrame.from_points(_seed_points(candle, bar - MINUTE_MS, 5))
+
+    async def main() -> None:
+        messages = [_kline(bar, 2.0, False), _kline(bar, 3.0, True), _kline(bar + MINUTE_MS, 4.0, False)]
+        async with _kline_server(monkeypatch, messages) as paths:
+            feed = LiveFeed(persist, capacity=50, flush_seconds=0.05)
+            key = ("binance", "BTCUSDT", "1m")
+            assert feed.subscribe(BinanceProvider(), "BTCUSDT", "1m", seed)
+            await _until(lambda: feed.stats()[0]["updates"] == 3)
+            window = feed.window(key, 3)
+            assert list(window.timestamp) == [bar - MINUTE_MS, bar, bar + MINUTE_MS]
+            assert list(window.close) == [1.0, 3.0, 4.0]
+            await _until(lambda: bool(persisted))
+            await feed.aclose()
+        assert paths == ["/ws/btcusdt@kline_1m"]
+
+    asyncio.run(main())
+    # Only the closed bar is written; the forming one stays in the buffer.
+    [(key, points)] = persisted
+    assert key == ("binance", "BTCUSDT", "1m")
+    assert [(int(point["timestamp"].timestamp() * 1000), point["close"]) for point in points] == [(bar, 3.0)]
+
+
+class _SeededProvider(BinanceProvider):
+    def __init__(self, candle: Callable[..., dict]) -> None:
+        super().__init__()
+        self.candle = candle
+
+    async def fetch_ohlcv(self, asset, timeframe, limit=300, since=None):
+        points = _seed_points(self.candle, int(time.time()) * 1000 // MINUTE_MS * MINUTE_MS - MINUTE_MS, limit)
+        return [point for point in points if since is None or point["timestamp"] >= since]
+
+
+def test_stop_stream_persists_closed_bars_and_falls_back_to_the_cache(monkeypatch, candle):
+    initialize_database()
+    manager = DataManager()
+    manager.providers["crypto"] = _SeededProvider(candle)
+    bar = int(time.time()) * 1000 // MINUTE_MS * MINUTE_MS
+
+    async def main() -> None:
+        messages = [_kline(bar, 7.0, True), _kline(bar + MINUTE_MS, 8.0, False)]
+        async with _kline_server(monkeypatch, messages):
+            manager.start_stream("crypto:STOPUSDT", "1m")
+            await _until(lambda: manager.live_stats()[0]["updates"] == 2)
+            live = await manager.get_ohlcv("crypto:STOPUSDT", "1m", limit=10)
+            assert live["source"] == "live"
+            assert list(live["data"].close)[-2:] == [7.0, 8.0]
+
+            assert await manager.stop_stream("crypto:STOPUSDT", "1m")
+            assert manager.live_stats() == []
+            await manager._writer.flush()
+            stored = manager.backend.load("binance", "STOPUSDT", "1m", 1)
+            assert (stored.timestamp[-1], stored.close[-1]) == (bar, 7.0)
+            cached = await manager.get_ohlcv("crypto:STOPUSDT", "1m", limit=10)
+            assert cached["source"] != "live"
+        await manager.aclose()
+
+    asyncio.run(main())
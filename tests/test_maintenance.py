@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.data.columnar_backend import ColumnarCacheBackend
+from app.data.data_manager import DataManager
+from app.data.database import initialize_database
+from app.data.frame import OHLCVFrame
+from app.data.maintenance import database_stats
+from app.data.sqlite_backend import SQLiteCacheBackend
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "columnar"])
+def test_retention_trims_every_backend_and_the_memory_tier(backend, tmp_path, candle):
+    initialize_database()
+    manager = DataManager(SQLiteCacheBackend() if backend == "sqlite" else ColumnarCacheBackend(tmp_path))
+    key = ("binance", f"RETAIN{backend.upper()}", "1m")
+    now = datetime.now(UTC).replace(second=0, microsecond=0)
+    # 1m keeps 90 days by default: two candles are past it, three are not.
+    old = [now - timedelta(days=120, minutes=offset) for offset in (1, 0)]
+    recent = [now - timedelta(minutes=offset) for offset in (2, 1, 0)]
+    manager.backend.upsert(*key, OHLCVFrame.from_points([candle(timestamp) for timestamp in old + recent]))
+    old_ms, recent_ms = int(old[0].timestamp() * 1000), int(recent[0].timestamp() * 1000)
+    manager.backend.record_empty_ranges(*key, [(old_ms - 120_000, old_ms - 60_000), (recent_ms - 60_000, recent_ms - 60_000)])
+
+    async def main() -> None:
+        window, _ = await manager._read_window(*key, 10)
+        assert len(window) == 5
+        result = await manager.run_maintenance()
+        assert {"provider": key[0], "asset": key[1], "timeframe": "1m", "rows": 2} in result["trimmed"]
+        window, _ = await manager._read_window(*key, 10)
+        assert len(window) == 3
+        await manager.aclose()
+
+    asyncio.run(main())
+    assert manager.backend.empty_ranges(*key) == [(recent_ms - 60_000, recent_ms - 60_000)]
+    series = [item for item in database_stats(manager.backend)["series"] if item["asset"] == key[1]]
+    assert [item["rows"] for item in series] == [3]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+from app.data import prewarmer
+from app.data.prewarmer import WatchlistPrewarmer
+
+
+class _Manager:
+    """Routes ``slow:`` assets to a provider whose refreshes hang until released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.refreshes: dict[str, int] = {"fast:A": 0, "slow:B": 0}
+
+    def provider_for(self, asset: str) -> SimpleNamespace:
+        return SimpleNamespace(name=asset.partition(":")[0], validate_timeframe=lambda timeframe: None)
+
+    async def get_ohlcv(self, asset: str, timeframe: str, refresh: bool = False) -> dict[str, object]:
+        self.refreshes[asset] += 1
+        if asset.startswith("slow:"):
+            await self.release.wait()
+        return {"source": "provider"}
+
+
+def test_a_slow_provider_lane_does_not_hold_up_the_others(monkeypatch):
+    # Every bar closes 20ms after the previous refresh.
+    monkeypatch.setattr(prewarmer, "next_bar_close", lambda now, timeframe: now + timedelta(seconds=0.02))
+
+    async def main() -> None:
+        manager = _Manager()
+        warmer = WatchlistPrewarmer(manager, [("fast:A", "1m"), ("slow:B", "1m")], delay_seconds=0, stagger_seconds=0)
+        warmer.start()
+        await asyncio.sleep(0.3)
+        assert manager.refreshes["slow:B"] == 1
+        assert manager.refreshes["fast:A"] >= 5
+        assert warmer.stats()["running"]
+        manager.release.set()
+        await warmer.aclose()
+        assert not warmer.stats()["running"]
+
+    asyncio.run(main())
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from app.data.database import initialize_database
+from app.data.sqlite_backend import SQLiteCacheBackend
+
+SERIES = ("binance", "EMPTYUSDT", "1m")
+MINUTE_MS = 60_000
+
+
+def test_record_empty_ranges_merges_repeated_fills():
+    initialize_database()
+    backend = SQLiteCacheBackend()
+    backend.record_empty_ranges(*SERIES, [(0, MINUTE_MS), (5 * MINUTE_MS, 6 * MINUTE_MS)])
+    backend.record_empty_ranges(*SERIES, [(0, MINUTE_MS)])
+    backend.record_empty_ranges(*SERIES, [(MINUTE_MS, 2 * MINUTE_MS)])
+
+    assert backend.empty_ranges(*SERIES) == [(0, 2 * MINUTE_MS), (5 * MINUTE_MS, 6 * MINUTE_MS)]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import random
+
+import pytest
+
+from app.regime.regime_classifier import RegimeClassifier
+from app.regime.streaming import StreamingRegimeClassifier
+
+
+def _candles(candle: Callable[..., dict], count: int, seed: int) -> list[dict]:
+    """Random walk with a flat stretch, zero closes and near-zero closes."""
+    rng = random.Random(seed)
+    price = 100.0
+    candles: list[dict] = []
+    for i in range(count):
+        if not 90 <= i < 200:
+            price *= 1 + rng.gauss(0.0003, 0.01)
+        close = price
+        if i in (220, 221, 300):
+            close = 0.0
+        elif i in (250, 251):
+            close = 1e-12
+        candles.append(candle(i * 3600, close=close, open=close, high=close * 1.002, low=close * 0.998))
+    return candles
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_each_update_matches_classify_on_the_same_history(seed, candle):
+    candles = _candles(candle, 360, seed)
+    streaming = StreamingRegimeClassifier()
+    batch = RegimeClassifier()
+    for fed in range(1, len(candles) + 1):
+        snapshot = streaming.update(candles[fed - 1])
+        window = batch.classify(candles[max(0, fed - 80) : fed])
+        assert snapshot.current_regime == window.current_regime, fed
+        assert snapshot.confidence_score == pytest.approx(window.confidence_score, abs=0.01), fed
+        # The distribution covers the whole history, so compare it at checkpoints.
+        if fed % 40 == 0 or fed in (1, 24, 25, 79, 80, len(candles)):
+            history = batch.classify(candles[:fed])
+            assert snapshot.historical_distribution == history.historical_distribution, fed
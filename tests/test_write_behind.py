@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.data.frame import OHLCVFrame
+from app.data.write_behind import WriteBehindWriter
+
+KEY = ("binance", "BTCUSDT", "1h")
+
+
+def _frame(*timestamps: int, close: float = 1.0) -> OHLCVFrame:
+    return OHLCVFrame.from_rows((ts, close, close, close, close, 1.0) for ts in timestamps)
+
+
+class _Backend:
+    def __init__(self, fail_times: int = 0) -> None:
+        self.fail_times = fail_times
+        self.calls: list[dict] = []
+
+    def upsert_many(self, batch):
+        self.calls.append(dict(batch))
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("database is locked")
+        return sum(len(frame) for frame in batch.values())
+
+
+def test_frames_for_one_series_are_merged_into_one_commit():
+    backend = _Backend()
+    writer = WriteBehindWriter(backend)
+
+    async def main() -> None:
+        await writer.submit(KEY, _frame(1, 2))
+        await writer.submit(KEY, _frame(2, 3, close=2.0))
+        await writer.aclose()
+
+    asyncio.run(main())
+    assert len(backend.calls) == 1
+    merged = backend.calls[0][KEY]
+    assert list(merged.timestamp) == [1, 2, 3]
+    assert list(merged.close) == [1.0, 2.0, 2.0]
+    assert writer.stats()["rows"] == 3
+
+
+def test_failed_commit_is_retried():
+    backend = _Backend(fail_times=1)
+    failed: list[tuple[str, str, str]] = []
+    writer = WriteBehindWriter(backend, on_failure=failed.append, retry_seconds=0)
+
+    async def main() -> None:
+        await writer.submit(KEY, _frame(1))
+        await writer.aclose()
+
+    asyncio.run(main())
+    assert len(backend.calls) == 2
+    assert failed == []
+    assert writer.stats()["retries"] == 1
+
+
+def test_dropped_batch_reports_its_series():
+    backend = _Backend(fail_times=10)
+    failed: list[tuple[str, str, str]] = []
+    writer = WriteBehindWriter(backend, on_failure=failed.append, max_attempts=2, retry_seconds=0)
+
+    async def main() -> None:
+        await writer.submit(KEY, _frame(1))
+        await writer.flush()
+        assert not writer.has_pending(KEY)
+        await writer.aclose()
+
+    asyncio.run(main())
+    assert len(backend.calls) == 2
+    assert failed == [KEY]
+    assert writer.stats()["failures"] == 1
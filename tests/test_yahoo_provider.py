@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from app.data.forex_provider import ForexProvider
+
+
+def test_short_volume_column_defaults_to_zero_instead_of_dropping_bars():
+    now = 1_700_000_000 // 3600 * 3600
+    timestamps = [now - 3600 * back for back in (3, 2, 1, 0)]
+    chart = {
+        "timestamp": timestamps,
+        "indicators": {
+            "quote": [
+                {
+                    "open": [1.0, 1.1, None, 1.3],
+                    "high": [1.5, 1.6, 1.7, 1.8],
+                    "low": [0.5, 0.6, 0.7, 0.8],
+                    "close": [1.2, 1.3, 1.4, 1.5],
+                    "volume": [10, None],
+                }
+            ]
+        },
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"chart": {"result": [chart]}})
+
+    provider = ForexProvider()
+    provider.attach_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    points = asyncio.run(provider.fetch_ohlcv("EURUSD", "1h", limit=10))
+
+    # The null-open bar is skipped; the bars past the volume column keep volume 0.
+    assert [int(point["timestamp"].timestamp()) for point in points] == [timestamps[0], timestamps[1], timestamps[3]]
+    assert [point["volume"] for point in points] == [10.0, 0.0, 0.0]